@@ -1,3 +1,4 @@
+import os
 from logging.config import fileConfig
 
 from sqlalchemy import create_engine, pool
@@ -20,6 +21,23 @@ target_metadata = Base.metadata
 def get_url():
     return settings.DATABASE_URL
 
+# Pool class for the online migration engine. Every revision runs on the single
+# connection opened in run_migrations_online() (op.get_bind() returns it, and so
+# migration_utils.bulk_insert uses it too), so the pool makes no difference to them.
+# ALEMBIC_POOL=queue (with optional ALEMBIC_POOL_SIZE) only matters to migration code
+# that opens further connections on the engine itself; the default is NullPool.
+# Data-only revisions should write rows with app.db.migration_utils.bulk_insert
+# rather than issuing one op.execute() per row.
+ALEMBIC_POOL = os.getenv("ALEMBIC_POOL", "null").lower()
+ALEMBIC_POOL_SIZE = int(os.getenv("ALEMBIC_POOL_SIZE", "5"))
+
+def get_engine_kwargs() -> dict:
+    if ALEMBIC_POOL == "queue":
+        return {"poolclass": pool.QueuePool, "pool_size": ALEMBIC_POOL_SIZE}
+    if ALEMBIC_POOL != "null":
+        raise ValueError(f"Unsupported ALEMBIC_POOL value: {ALEMBIC_POOL!r} (expected 'null' or 'queue')")
+    return {"poolclass": pool.NullPool}
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -46,7 +64,7 @@ def run_migrations_online() -> None:
     """Run migrations in 'online' mode using synchronous engine."""
     configuration = config.get_section(config.config_ini_section, {})
     configuration["sqlalchemy.url"] = get_url()
-    connectable = create_engine(configuration["sqlalchemy.url"], poolclass=pool.NullPool)
+    connectable = create_engine(configuration["sqlalchemy.url"], **get_engine_kwargs())
 
     with connectable.connect() as connection:
         context.configure(connection=connection, target_metadata=target_metadata)
@@ -0,0 +1,23 @@
+"""Add csv_files (user_id, created_at) index
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 10:12:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_csv_files_user_created', 'csv_files', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_csv_files_user_created', table_name='csv_files')
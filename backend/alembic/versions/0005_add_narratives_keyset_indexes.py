@@ -0,0 +1,28 @@
+"""Add narratives (created_at, id) keyset indexes
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 14:05:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Listing pages seek on (created_at, id); the per-user index gains id so it serves the same seek
+    op.create_index('ix_narratives_created_id', 'narratives', ['created_at', 'id'], unique=False)
+    op.create_index('ix_narratives_user_created_id', 'narratives', ['user_id', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_narratives_user_created', table_name='narratives')
+
+
+def downgrade():
+    op.create_index('ix_narratives_user_created', 'narratives', ['user_id', 'created_at'], unique=False)
+    op.drop_index('ix_narratives_user_created_id', table_name='narratives')
+    op.drop_index('ix_narratives_created_id', table_name='narratives')
@@ -0,0 +1,74 @@
+"""Move narrative tags into a narrative_tags table
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16 16:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migration_utils import bulk_insert
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+narratives = sa.table(
+    'narratives',
+    sa.column('id', sa.Integer),
+    sa.column('tags', sa.String),
+)
+
+
+def upgrade():
+    narrative_tags = op.create_table('narrative_tags',
+    sa.Column('narrative_id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=500), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['narrative_id'], ['narratives.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('narrative_id', 'name')
+    )
+    op.create_index('ix_narrative_tags_name', 'narrative_tags', ['name', 'narrative_id'], unique=False)
+
+    # Split on commas and strip whitespace, skipping empty names; repeats are dropped
+    # (first occurrence keeps its position) since (narrative_id, name) is the key
+    rows = []
+    tagged = op.get_bind().execute(sa.select(narratives.c.id, narratives.c.tags).where(narratives.c.tags.isnot(None)))
+    for narrative_id, tags in tagged:
+        names = dict.fromkeys(tag.strip() for tag in tags.split(',') if tag.strip())
+        rows.extend(
+            {'narrative_id': narrative_id, 'name': name, 'position': position}
+            for position, name in enumerate(names)
+        )
+    bulk_insert(narrative_tags, rows)
+
+    op.drop_column('narratives', 'tags')
+
+
+def downgrade():
+    op.add_column('narratives', sa.Column('tags', sa.String(length=500), nullable=True))
+
+    narrative_tags = sa.table(
+        'narrative_tags',
+        sa.column('narrative_id', sa.Integer),
+        sa.column('name', sa.String),
+        sa.column('position', sa.Integer),
+    )
+    bind = op.get_bind()
+    tags_by_id = {}
+    for narrative_id, name in bind.execute(
+        sa.select(narrative_tags.c.narrative_id, narrative_tags.c.name)
+        .order_by(narrative_tags.c.narrative_id, narrative_tags.c.position)
+    ):
+        tags_by_id.setdefault(narrative_id, []).append(name)
+    for narrative_id, names in tags_by_id.items():
+        bind.execute(
+            narratives.update().where(narratives.c.id == narrative_id).values(tags=', '.join(names))
+        )
+
+    op.drop_index('ix_narrative_tags_name', table_name='narrative_tags')
+    op.drop_table('narrative_tags')
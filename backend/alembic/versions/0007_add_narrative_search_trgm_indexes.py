@@ -0,0 +1,36 @@
+"""Add pg_trgm indexes for narrative search
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16 17:40:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+SEARCH_COLUMNS = ('title', 'summary', 'content')
+
+
+def upgrade():
+    # Trigram indexes let ILIKE '%q%' search avoid a sequential scan; Postgres only
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f'ix_narratives_{column}_trgm', 'narratives', [column], unique=False,
+            postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for column in reversed(SEARCH_COLUMNS):
+        op.drop_index(f'ix_narratives_{column}_trgm', table_name='narratives')
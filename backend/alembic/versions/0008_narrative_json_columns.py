@@ -0,0 +1,43 @@
+"""Store narrative structured fields as jsonb
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16 18:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+JSON_COLUMNS = ('key_insights', 'recommendations', 'sections', 'metadata', 'patterns')
+
+
+def upgrade():
+    # The columns already hold json.dumps() output, so Postgres can cast them in place.
+    # Elsewhere JSON is stored as text and the existing values need no change.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            'narratives', column,
+            type_=postgresql.JSONB(), existing_type=sa.Text(), existing_nullable=True,
+            postgresql_using=f'{column}::jsonb'
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            'narratives', column,
+            type_=sa.Text(), existing_type=postgresql.JSONB(), existing_nullable=True,
+            postgresql_using=f'{column}::text'
+        )
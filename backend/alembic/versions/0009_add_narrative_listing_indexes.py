@@ -0,0 +1,35 @@
+"""Add narrative listing indexes for the common filters
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16 19:10:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    'ix_narratives_user_archived_created_id': ['user_id', 'is_archived', 'created_at', 'id'],
+    'ix_narratives_user_type_created_id': ['user_id', 'narrative_type', 'created_at', 'id'],
+    'ix_narratives_csv_file_created_id': ['csv_file_id', 'created_at', 'id'],
+}
+
+
+def upgrade():
+    # CONCURRENTLY on Postgres so listing keeps working while the indexes build;
+    # it cannot run inside a transaction, hence the autocommit block
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES.items():
+            op.create_index(name, 'narratives', columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name in reversed(list(INDEXES)):
+            op.drop_index(name, table_name='narratives', postgresql_concurrently=True)
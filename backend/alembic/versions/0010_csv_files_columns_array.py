@@ -0,0 +1,41 @@
+"""Store csv_files.columns as text[]
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16 20:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The column holds json.dumps() output. ALTER ... USING can't take the subquery that
+    # unpacks a JSON array, so fill a new column and swap it in. Elsewhere the JSON text
+    # is what the model reads, so nothing changes.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.add_column('csv_files', sa.Column('columns_array', postgresql.ARRAY(sa.Text()), nullable=True))
+    op.execute(
+        "UPDATE csv_files SET columns_array = ARRAY(SELECT jsonb_array_elements_text(columns::jsonb)) "
+        "WHERE columns IS NOT NULL"
+    )
+    op.drop_column('csv_files', 'columns')
+    op.alter_column('csv_files', 'columns_array', new_column_name='columns')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.add_column('csv_files', sa.Column('columns_json', sa.String(), nullable=True))
+    op.execute("UPDATE csv_files SET columns_json = array_to_json(columns)::text WHERE columns IS NOT NULL")
+    op.drop_column('csv_files', 'columns')
+    op.alter_column('csv_files', 'columns_json', new_column_name='columns')
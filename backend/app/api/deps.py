@@ -1,20 +1,64 @@
-from typing import Generator, Optional
+import hashlib
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Generator, Optional
 
+from cachetools import TLRUCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+from jose import JWTError
 from sqlalchemy.orm import Session
 
-from app.core.config import settings
-from app.core.security import ALGORITHM
+from app.core.config import get_settings, settings
+from app.core.security import verify_hs256
 from app.db.session import SessionLocal
+from app.crud.csv_file_cache import CSVFileRef
 from app.models.user import User
+from app.services.narrative_service import NarrativeService
 from app import crud
 
+# auto_error=False so the same scheme backs both required and optional auth
 reusable_oauth2 = OAuth2PasswordBearer(
-    tokenUrl=f"{settings.API_V1_STR}/auth/login"
+    tokenUrl=f"{settings.API_V1_STR}/auth/login", auto_error=False
 )
 
+JWT_CACHE_TTL_SECONDS = 30
+
+@lru_cache(maxsize=1)
+def _encode_secret_key(secret_key: str) -> bytes:
+    return secret_key.encode()
+
+def _secret_key_bytes() -> bytes:
+    # Read at call time (keyed on the current value) so a rebuilt Settings is picked up
+    return _encode_secret_key(get_settings().SECRET_KEY)
+
+def _jwt_cache_ttu(key: str, payload: Dict[str, Any], now: float) -> float:
+    # Never keep a payload around past the token's own expiry
+    remaining = JWT_CACHE_TTL_SECONDS
+    exp = payload.get("exp")
+    if exp is not None:
+        remaining = min(remaining, exp - time.time())
+    return now + remaining
+
+# Successfully verified JWT payloads keyed by a 128-bit blake2b digest of the raw token
+_jwt_cache = TLRUCache(maxsize=10000, ttu=_jwt_cache_ttu)
+_jwt_cache_lock = threading.Lock()
+
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """Decode and verify a JWT, reusing recently verified payloads.
+    Raises JWTError if the token is invalid; failures are never cached."""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(key)
+    if payload is not None:
+        return payload
+
+    payload = verify_hs256(token, _secret_key_bytes())
+    with _jwt_cache_lock:
+        _jwt_cache[key] = payload
+    return payload
+
 def get_db() -> Generator:
     try:
         db = SessionLocal()
@@ -22,26 +66,35 @@ def get_db() -> Generator:
     finally:
         db.close()
 
-async def get_current_user(
+def get_narrative_service(db: Session = Depends(get_db)) -> NarrativeService:
+    # Cheap to build: templates live in a shared, process-wide Jinja environment
+    return NarrativeService(db)
+
+def get_current_user(
     db: Session = Depends(get_db),
-    token: str = Depends(reusable_oauth2)
+    token: Optional[str] = Depends(reusable_oauth2)
 ) -> User:
+    if token is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[ALGORITHM]
-        )
-        user_id: Optional[int] = payload.get("sub")
-        if user_id is None:
+        payload = decode_access_token(token)
+        sub = payload.get("sub")
+        if sub is None:
             raise credentials_exception
-    except JWTError:
+        user_id = int(sub)
+    except (JWTError, ValueError):
         raise credentials_exception
     
-    user = crud.user.get(db, id=user_id)
+    user = crud.user_cache.get_cached(db, user_id)
     if not user:
         raise credentials_exception
     return user
@@ -56,27 +109,45 @@ def get_current_active_user(
         )
     return current_user
 
-async def get_optional_current_user(
-    authorization: Optional[str] = Depends(lambda: None),
+def get_optional_current_user(
     db: Session = Depends(get_db),
+    token: Optional[str] = Depends(reusable_oauth2),
 ) -> Optional[User]:
     """Get current user if authenticated, otherwise return None.
     This allows endpoints to work with or without authentication."""
-    # Check Authorization header manually since we want optional auth
-    from fastapi import Request
-    try:
-        # This will be set by the endpoint using Header() dependency
-        if hasattr(authorization, 'authorization'):
-            auth_header = authorization.authorization
-        else:
-            return None
-    except:
-        return None
-    
-    if not auth_header or not auth_header.startswith("Bearer "):
+    # Anonymous requests return before any token or database work
+    if token is None:
         return None
     try:
-        token = auth_header.replace("Bearer ", "")
-        return await get_current_user(token=token, db=db)
-    except (HTTPException, Exception):
-        return None
\ No newline at end of file
+        return get_current_user(db=db, token=token)
+    except HTTPException:
+        return None
+
+FILE_NOT_FOUND_DETAIL = "File not found"
+FILE_FORBIDDEN_DETAIL = "You don't have permission to access this file"
+
+def get_accessible_file(
+    db: Session, file_id: int, current_user: Optional[User]
+) -> CSVFileRef:
+    """Resolve a CSV file, raising 404 if it is missing and 403 if it belongs
+    to someone other than the authenticated user. Anonymous access is allowed."""
+    csv_file = crud.csv_file_cache.get_cached(db, file_id)
+    if not csv_file:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=FILE_NOT_FOUND_DETAIL
+        )
+    if current_user and csv_file.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=FILE_FORBIDDEN_DETAIL
+        )
+    return csv_file
+
+def get_owned_file(
+    file_id: int,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_optional_current_user),
+) -> CSVFileRef:
+    """Dependency form of get_accessible_file for routes with a file_id path parameter."""
+    return get_accessible_file(db, file_id, current_user)
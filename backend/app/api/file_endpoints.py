@@ -0,0 +1,46 @@
+from typing import Any, Awaitable, Callable, Optional, Type
+
+from fastapi import Depends, HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.core.workers import run_sync
+from app.models.user import User
+
+
+def make_file_endpoint(
+    name: str,
+    request_model: Type[BaseModel],
+    service_fn: Callable[..., Awaitable[Any]],
+    doc: str,
+) -> Callable[..., Awaitable[Any]]:
+    """
+    Build a POST handler that runs service_fn against the CSV file named by the body's file_id.
+    Every request field other than file_id is passed to service_fn by name, so request
+    schemas and service signatures must use the same parameter names. ValueErrors from
+    the service become 400s; anything else is left to the app-level error handler.
+    """
+    # The file is resolved here rather than in a dependency: a dependency declaring the
+    # same body model would make FastAPI validate the request body a second time
+    async def handler(
+        request: request_model,
+        db: Session = Depends(deps.get_db),
+        current_user: Optional[User] = Depends(deps.get_optional_current_user),
+    ):
+        csv_file = await run_sync(deps.get_accessible_file, db, request.file_id, current_user)
+        
+        try:
+            return await service_fn(
+                file_path=csv_file.file_path,
+                **request.model_dump(exclude={"file_id"})
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+    
+    handler.__name__ = name
+    handler.__doc__ = doc
+    return handler
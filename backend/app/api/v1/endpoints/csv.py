@@ -1,31 +1,20 @@
 from typing import Dict, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, status, Header
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, status, Query
 from sqlalchemy.orm import Session
 
-from app import crud, deps
+from app import crud
+from app.api import deps
+from app.core.responses import FastJSONResponse
 from app.models.user import User
 from app.services.csv_processor import process_csv_file, CSVProcessingError
 
 router = APIRouter()
 
-async def get_optional_current_user(
-    authorization: Optional[str] = Header(None),
-    db: Session = Depends(deps.get_db),
-) -> Optional[User]:
-    """Get current user if authenticated, otherwise return None"""
-    if not authorization or not authorization.startswith("Bearer "):
-        return None
-    try:
-        token = authorization.replace("Bearer ", "")
-        return await deps.get_current_user(token=token, db=db)
-    except (HTTPException, Exception):
-        return None
-
 @router.post("/upload")
 async def upload_csv(
     file: UploadFile = File(...),
     db: Session = Depends(deps.get_db),
-    current_user: Optional[User] = Depends(get_optional_current_user),
+    current_user: Optional[User] = Depends(deps.get_optional_current_user),
 ) -> Dict[str, Any]:
     """
     Upload and process a CSV file.
@@ -43,29 +32,13 @@ async def upload_csv(
         await file.seek(0)
         
         # Process CSV file using the proper service
-        file_info, preview_data, statistics = await process_csv_file(
+        file_info, preview_data, statistics, created_file = await process_csv_file(
             file=file,
             user_id=current_user.id,
             db=db,
             user_is_premium=False
         )
         
-        # The process_csv_file function saves to DB and returns file_info
-        # Get the most recently created file for this user
-        db_files = crud.csv_file.get_by_user(
-            db=db,
-            user_id=current_user.id,
-            limit=1
-        )
-        
-        if not db_files:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="File was processed but not found in database"
-            )
-        
-        created_file = db_files[0]
-        
         return {
             "message": "File uploaded successfully",
             "file": {
@@ -75,14 +48,8 @@ async def upload_csv(
             "statistics": {
                 "total_rows": statistics.get('total_rows', file_info.row_count),
                 "total_columns": len(file_info.columns or []),
-                "numeric_columns": [
-                    col for col, stats in statistics.get('columns', {}).items()
-                    if stats.get('type', '').startswith(('int', 'float'))
-                ],
-                "categorical_columns": [
-                    col for col, stats in statistics.get('columns', {}).items()
-                    if stats.get('type', '').startswith('object')
-                ]
+                "numeric_columns": statistics['numeric_columns'],
+                "categorical_columns": statistics['categorical_columns']
             },
             "column_preview": preview_data
         }
@@ -92,19 +59,14 @@ async def upload_csv(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error processing file: {str(e)}"
-        )
 
-@router.get("/files")
-async def list_files(
+@router.get("/files", response_class=FastJSONResponse)
+def list_files(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
     db: Session = Depends(deps.get_db),
-    current_user: Optional[User] = Depends(get_optional_current_user),
-) -> Dict[str, Any]:
+    current_user: Optional[User] = Depends(deps.get_optional_current_user),
+) -> FastJSONResponse:
     """
     List all CSV files for the authenticated user.
     """
@@ -114,17 +76,20 @@ async def list_files(
             detail="Authentication required"
         )
     
-    files = crud.csv_file.get_by_user(db=db, user_id=current_user.id)
+    files = crud.csv_file.get_summaries_by_user(
+        db=db, user_id=current_user.id, skip=skip, limit=limit
+    )
     
-    return {
+    # Returned directly so created_at datetimes are serialized by orjson
+    return FastJSONResponse({
         "files": [
             {
-                "id": f.id,
-                "filename": f.original_filename,
-                "row_count": f.row_count,
-                "columns": f.columns,
-                "created_at": f.created_at.isoformat() if f.created_at else None
+                "id": file_id,
+                "filename": original_filename,
+                "row_count": row_count,
+                "columns": columns or None,
+                "created_at": created_at
             }
-            for f in files
+            for file_id, original_filename, row_count, columns, created_at in files
         ]
-    }
+    })
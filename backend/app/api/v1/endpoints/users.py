@@ -1,7 +1,5 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
 
-from app import crud
 from app.api import deps
 from app.models.user import User
 from app.schemas.user import User as UserSchema
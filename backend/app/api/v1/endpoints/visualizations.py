@@ -1,229 +1,86 @@
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Header
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
-from app import crud
 from app.api import deps
-from app.models.user import User
+from app.api.file_endpoints import make_file_endpoint
+from app.core.responses import etag_matches, not_modified
+from app.crud.csv_file_cache import CSVFileRef
 from app.schemas.visualizations import (
     ScatterPlotRequest,
     HistogramRequest,
     BoxplotRequest,
-    BarChartRequest,
-    LineChartRequest,
     VisualizationResponse,
     ChartSuggestionsResponse
 )
+from app.services import file_cache
 from app.services.visualization_service import VisualizationService
 
 router = APIRouter()
 
-async def get_optional_current_user(
-    authorization: Optional[str] = Header(None),
-    db: Session = Depends(deps.get_db),
-) -> Optional[User]:
-    """Get current user if authenticated, otherwise return None"""
-    if not authorization or not authorization.startswith("Bearer "):
-        return None
-    try:
-        token = authorization.replace("Bearer ", "")
-        return await deps.get_current_user(token=token, db=db)
-    except (HTTPException, Exception):
-        return None
-
+SUGGESTIONS_CACHE_CONTROL = "private, max-age=60"
 
-@router.post("/scatter", response_model=VisualizationResponse)
-async def create_scatter_plot(
-    request: ScatterPlotRequest,
-    db: Session = Depends(deps.get_db),
-    current_user: Optional[User] = Depends(get_optional_current_user),
-) -> VisualizationResponse:
+create_scatter_plot = make_file_endpoint(
+    "create_scatter_plot",
+    ScatterPlotRequest,
+    VisualizationService.create_scatter_plot,
     """
     Create a scatter plot visualization.
     
     Plots two numeric variables against each other, with optional color and size grouping.
-    """
-    # Get the file
-    csv_file = crud.csv_file.get(db=db, id=request.file_id)
-    if not csv_file:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="File not found"
-        )
-    
-    # Check ownership if user is authenticated
-    if current_user:
-        if csv_file.user_id != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have permission to access this file"
-            )
-    
-    try:
-        result = await VisualizationService.create_scatter_plot(
-            file_path=csv_file.file_path,
-            x_column=request.x_column,
-            y_column=request.y_column,
-            color_column=request.color_column,
-            size_column=request.size_column,
-            title=request.title,
-            x_label=request.x_label,
-            y_label=request.y_label,
-            color_scheme=request.color_scheme
-        )
-        return result
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error creating scatter plot: {str(e)}"
-        )
-
+    """,
+)
 
-@router.post("/histogram", response_model=VisualizationResponse)
-async def create_histogram(
-    request: HistogramRequest,
-    db: Session = Depends(deps.get_db),
-    current_user: Optional[User] = Depends(get_optional_current_user),
-) -> VisualizationResponse:
+create_histogram = make_file_endpoint(
+    "create_histogram",
+    HistogramRequest,
+    VisualizationService.create_histogram,
     """
     Create a histogram visualization.
     
     Shows the distribution of a numeric variable, with optional grouping.
-    """
-    # Get the file
-    csv_file = crud.csv_file.get(db=db, id=request.file_id)
-    if not csv_file:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="File not found"
-        )
-    
-    # Check ownership if user is authenticated
-    if current_user:
-        if csv_file.user_id != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have permission to access this file"
-            )
-    
-    try:
-        result = await VisualizationService.create_histogram(
-            file_path=csv_file.file_path,
-            column=request.column,
-            bins=request.bins,
-            group_column=request.group_column,
-            title=request.title,
-            x_label=request.x_label,
-            y_label=request.y_label,
-            color_scheme=request.color_scheme
-        )
-        return result
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error creating histogram: {str(e)}"
-        )
-
+    """,
+)
 
-@router.post("/boxplot", response_model=VisualizationResponse)
-async def create_boxplot(
-    request: BoxplotRequest,
-    db: Session = Depends(deps.get_db),
-    current_user: Optional[User] = Depends(get_optional_current_user),
-) -> VisualizationResponse:
+create_boxplot = make_file_endpoint(
+    "create_boxplot",
+    BoxplotRequest,
+    VisualizationService.create_boxplot,
     """
     Create a boxplot visualization.
     
     Shows the distribution and outliers of a numeric variable, with optional grouping.
-    """
-    # Get the file
-    csv_file = crud.csv_file.get(db=db, id=request.file_id)
-    if not csv_file:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="File not found"
-        )
-    
-    # Check ownership if user is authenticated
-    if current_user:
-        if csv_file.user_id != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have permission to access this file"
-            )
-    
-    try:
-        result = await VisualizationService.create_boxplot(
-            file_path=csv_file.file_path,
-            y_column=request.y_column,
-            x_column=request.x_column,
-            title=request.title,
-            x_label=request.x_label,
-            y_label=request.y_label,
-            color_scheme=request.color_scheme
-        )
-        return result
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error creating boxplot: {str(e)}"
-        )
+    """,
+)
+
+router.post("/scatter", response_model=VisualizationResponse)(create_scatter_plot)
+router.post("/histogram", response_model=VisualizationResponse)(create_histogram)
+router.post("/boxplot", response_model=VisualizationResponse)(create_boxplot)
 
 
 @router.get("/suggestions/{file_id}", response_model=ChartSuggestionsResponse)
 async def get_chart_suggestions(
-    file_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: Optional[User] = Depends(get_optional_current_user),
+    request: Request,
+    response: Response,
+    csv_file: CSVFileRef = Depends(deps.get_owned_file),
 ) -> ChartSuggestionsResponse:
     """
     Get chart suggestions based on data characteristics.
     
     Analyzes the dataset and suggests appropriate chart types with confidence scores.
+    A matching If-None-Match for the current file version gets a 304.
     """
-    # Get the file
-    csv_file = crud.csv_file.get(db=db, id=file_id)
-    if not csv_file:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="File not found"
-        )
-    
-    # Check ownership if user is authenticated
-    if current_user:
-        if csv_file.user_id != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have permission to access this file"
-            )
-    
     try:
+        etag = file_cache.etag_for("chart_suggestions", csv_file.file_path)
+        if etag_matches(request, etag):
+            return not_modified(etag, SUGGESTIONS_CACHE_CONTROL)
+        
         result = await VisualizationService.suggest_charts(
             file_path=csv_file.file_path
         )
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = SUGGESTIONS_CACHE_CONTROL
         return result
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error analyzing data for suggestions: {str(e)}"
         )
\ No newline at end of file
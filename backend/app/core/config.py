@@ -1,4 +1,5 @@
-from typing import List
+from functools import cache, cached_property
+from typing import List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -11,13 +12,33 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     API_V1_STR: str = "/api/v1"
     UPLOAD_DIR: str = "./uploads"
+    NARRATIVE_BATCH_CONCURRENCY: int = 8
+    WORKER_THREADS: int = 16
+    STATS_PROCESS_WORKERS: Optional[int] = None  # None: one per CPU
 
-    @property
+    @cached_property
     def CORS_ORIGINS_LIST(self) -> List[str]:
+        # Parsed once per Settings instance; safe because the model is frozen.
+        # Browsers send Origin without a trailing slash, so "https://x.com/" would never
+        # match; blanks from stray commas are dropped
         if not self.CORS_ORIGINS:
             return []
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+        origins = (origin.strip().rstrip("/") for origin in self.CORS_ORIGINS.split(","))
+        return list(dict.fromkeys(origin for origin in origins if origin))
 
-    model_config = SettingsConfigDict(env_file=".env")
+    # Frozen: settings are read-only after startup and shared across threads
+    model_config = SettingsConfigDict(env_file=".env", frozen=True)
 
-settings = Settings()
+@cache
+def get_settings() -> Settings:
+    """
+    The process-wide Settings, built on first use rather than at import.
+    Tests can call get_settings.cache_clear() to pick up a changed environment.
+    """
+    return Settings()
+
+def __getattr__(name: str):
+    # Keeps `from app.core.config import settings` working without building Settings at import
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
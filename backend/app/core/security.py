@@ -1,7 +1,12 @@
+import base64
+import hashlib
+import hmac
+import json
+import time
 from datetime import datetime, timedelta
-from typing import Any, Union
+from typing import Any, Dict, Union
 
-from jose import jwt
+from jose import jwt, JWTError
 from passlib.context import CryptContext
 
 from app.core.config import settings
@@ -10,6 +15,10 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# Bound once instead of being rebuilt for every fallback decode
+_JWT_ALGORITHMS = (ALGORITHM,)
+_JWT_DECODE_OPTIONS = {"verify_aud": False}
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def create_access_token(
@@ -29,4 +38,54 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
\ No newline at end of file
+    return pwd_context.hash(password)
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def verify_hs256(token: str, secret: Union[str, bytes]) -> Dict[str, Any]:
+    """
+    Verify an HS256 JWT and return its claims without going through python-jose.
+    Tokens signed with any other algorithm are handed to jose.jwt.decode, which
+    rejects them since only HS256 is accepted. Raises JWTError on any failure.
+    """
+    try:
+        signing_input, _, encoded_sig = token.rpartition(".")
+        encoded_header, _, encoded_payload = signing_input.partition(".")
+        header = json.loads(_b64url_decode(encoded_header))
+        if not isinstance(header, dict):
+            raise JWTError("Invalid header")
+        if header.get("alg") != ALGORITHM:
+            return jwt.decode(
+                token, secret, algorithms=_JWT_ALGORITHMS, options=_JWT_DECODE_OPTIONS
+            )
+
+        key = secret.encode() if isinstance(secret, str) else secret
+        expected = hmac.new(
+            key, signing_input.encode("ascii"), hashlib.sha256
+        ).digest()
+        if not encoded_payload or not hmac.compare_digest(expected, _b64url_decode(encoded_sig)):
+            raise JWTError("Signature verification failed")
+
+        payload = json.loads(_b64url_decode(encoded_payload))
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise JWTError(f"Invalid token: {e}")
+
+    if not isinstance(payload, dict):
+        raise JWTError("Invalid payload")
+    now = time.time()
+    exp = payload.get("exp")
+    if exp is not None:
+        if not isinstance(exp, (int, float)):
+            raise JWTError("Expiration Time claim (exp) must be an integer.")
+        if exp <= now:
+            raise JWTError("Signature has expired.")
+    nbf = payload.get("nbf")
+    if nbf is not None:
+        if not isinstance(nbf, (int, float)):
+            raise JWTError("Not Before claim (nbf) must be an integer.")
+        if nbf > now:
+            raise JWTError("The token is not yet valid (nbf)")
+    return payload
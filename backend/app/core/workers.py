@@ -0,0 +1,92 @@
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+from app.services.stats_kernels import warm_up as warm_up_stats_kernels
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_process_pool: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Process-wide pool for blocking work (sync DB calls, narrative generation)
+    awaited from async endpoints. Created on first use, or at startup by the
+    app lifespan, and sized by WORKER_THREADS rather than the default executor's cpu-based limit.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.WORKER_THREADS, thread_name_prefix="worker"
+                )
+    return _executor
+
+
+def _process_pool_size() -> int:
+    return settings.STATS_PROCESS_WORKERS or os.cpu_count() or 1
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Process pool for CPU-bound statistics, so concurrent tests run on separate
+    cores instead of contending for the GIL. Workers are spawned rather than
+    forked, since the server process already runs threads, and each one warms
+    up the stats kernels as it starts. Sized by STATS_PROCESS_WORKERS (default:
+    one per CPU).
+    """
+    global _process_pool
+    if _process_pool is None:
+        with _executor_lock:
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=_process_pool_size(),
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=warm_up_stats_kernels,
+                )
+    return _process_pool
+
+
+def start_process_pool() -> None:
+    """
+    Create the stats pool and start all of its workers, called from the app lifespan.
+    Spawned workers are otherwise started one per submitted task, so the first
+    requests would pay for the spawn, the pandas/scipy imports and the kernel compile.
+    """
+    pool = get_process_pool()
+    # A submit starts a new worker whenever none is idle, and every worker is still busy
+    # running its initializer here, so one no-op per worker starts them all
+    for _ in range(_process_pool_size()):
+        pool.submit(os.getpid)
+
+
+def shutdown_executor() -> None:
+    global _executor, _process_pool
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=True)
+            _process_pool = None
+
+
+async def run_sync(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking callable on the shared worker pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(fn, *args, **kwargs))
+
+
+async def run_in_process(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a picklable, module-level callable in the stats process pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), functools.partial(fn, *args, **kwargs))
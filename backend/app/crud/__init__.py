@@ -1,4 +1,4 @@
-from . import csv_file, user
+from . import csv_file, csv_file_cache, user, user_cache
 
 # For convenience, expose commonly used CRUD operations at the module level
 from .user import get_by_email, authenticate
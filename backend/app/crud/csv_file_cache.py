@@ -0,0 +1,43 @@
+import threading
+from typing import NamedTuple, Optional
+
+from cachetools import TTLCache
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.csv_file import CSVFile
+
+
+class CSVFileRef(NamedTuple):
+    """The parts of a CSVFile needed to authorize and read it."""
+    id: int
+    file_path: str
+    user_id: Optional[int]
+
+
+# file_path and user_id never change after upload, so a short TTL only bounds
+# how long a file deleted by another process can still be resolved
+_cache = TTLCache(maxsize=1024, ttl=30)
+_cache_lock = threading.Lock()
+
+def get_cached(db: Session, id: int) -> Optional[CSVFileRef]:
+    """Resolve a file's path and owner, skipping the SELECT for recently seen ids.
+    Missing files are not cached."""
+    with _cache_lock:
+        ref = _cache.get(id)
+    if ref is not None:
+        return ref
+
+    row = db.execute(
+        select(CSVFile.id, CSVFile.file_path, CSVFile.user_id).where(CSVFile.id == id)
+    ).first()
+    if row is None:
+        return None
+    ref = CSVFileRef(*row)
+    with _cache_lock:
+        _cache[id] = ref
+    return ref
+
+def invalidate(id: int) -> None:
+    with _cache_lock:
+        _cache.pop(id, None)
@@ -2,16 +2,106 @@
 CRUD operations for narratives
 """
 
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, and_, or_
+import base64
+import binascii
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session, lazyload, load_only
+from sqlalchemy import case, delete, desc, asc, func, insert, not_, or_, select, tuple_, update
 
-from app.models.narrative import Narrative
+from app.models.narrative import Narrative, NarrativeTag
 from app.schemas.narratives import NarrativeResponse
 
 
+# Columns returned by narrative listings; everything except the large text/JSON fields.
+# Tags are attached separately by get_narrative_summaries.
+SUMMARY_COLUMNS = (
+    Narrative.id,
+    Narrative.title,
+    Narrative.summary,
+    Narrative.narrative_type,
+    Narrative.insights_count,
+    Narrative.patterns_count,
+    Narrative.data_quality_score,
+    Narrative.is_favorite,
+    Narrative.is_archived,
+    Narrative.created_at,
+    Narrative.updated_at,
+)
+
+# ORM listings load just the summary columns; content and the JSON fields stay
+# deferred until an attribute is read (the detail endpoint uses get_narrative)
+SUMMARY_LOAD = load_only(*SUMMARY_COLUMNS)
+
+# Fields update_narrative accepts; the MODEL_UPDATED_FIELDS subset needs the ORM object
+UPDATABLE_FIELDS = frozenset({
+    'title', 'summary', 'content', 'is_favorite',
+    'is_archived', 'tags', 'key_insights', 'recommendations'
+})
+MODEL_UPDATED_FIELDS = frozenset({'tags', 'key_insights'})
+
+# Sort keys listings accept; anything else falls back to created_at
+ORDERABLE_COLUMNS = {
+    'created_at': Narrative.created_at,
+    'updated_at': Narrative.updated_at,
+    'title': Narrative.title,
+    'insights_count': Narrative.insights_count,
+    'id': Narrative.id,
+}
+
+# Narrative types listed first, in this order, by get_narrative_stats
+NARRATIVE_STAT_TYPES = ('statistical_test', 'data_summary', 'visualization')
+
+
+def encode_cursor(created_at: datetime, narrative_id: int) -> str:
+    """Opaque keyset cursor pointing just past the given (created_at, id) row."""
+    raw = f"{created_at.isoformat()}|{narrative_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of encode_cursor. Raises ValueError for anything it did not produce."""
+    try:
+        created_at, narrative_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|")
+        return datetime.fromisoformat(created_at), int(narrative_id)
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValueError("Invalid pagination cursor")
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input matches literally (escape character: backslash)."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 class NarrativeCRUD:
     
+    @staticmethod
+    def _narrative_values(
+        narrative_data: NarrativeResponse,
+        csv_file_id: Optional[int],
+        user_id: Optional[int]
+    ) -> Dict[str, Any]:
+        """Column values for a new narrative, keyed by mapped attribute name."""
+        metadata = narrative_data.metadata
+        # mode="json" turns enums and datetimes into JSON-ready values
+        key_insights = [insight.model_dump(mode="json") for insight in narrative_data.key_insights]
+        return {
+            'title': narrative_data.title,
+            'summary': narrative_data.summary,
+            'content': narrative_data.content,
+            'narrative_type': narrative_data.narrative_type.value,
+            'csv_file_id': csv_file_id,
+            'user_id': user_id,
+            'generation_method': metadata.generation_method.value,
+            'generation_time_ms': metadata.generation_time_ms,
+            'data_quality_score': getattr(metadata, 'quality_score', None),
+            'key_insights': key_insights or None,
+            'insights_count': len(key_insights),
+            'recommendations': narrative_data.recommendations or None,
+            'sections': [section.model_dump(mode="json") for section in narrative_data.sections] or None,
+            'extra_metadata': metadata.model_dump(mode="json") if metadata else None,
+        }
+    
     def create_narrative(
         self, 
         db: Session, 
@@ -20,42 +110,46 @@ class NarrativeCRUD:
         user_id: Optional[int] = None
     ) -> Narrative:
         """Create a new narrative in the database."""
-        
-        # Convert NarrativeResponse to database model
-        narrative = Narrative(
-            title=narrative_data.title,
-            summary=narrative_data.summary,
-            content=narrative_data.content,
-            narrative_type=narrative_data.narrative_type.value,
-            csv_file_id=csv_file_id,
-            user_id=user_id,
-            generation_method=narrative_data.metadata.generation_method.value,
-            generation_time_ms=narrative_data.metadata.generation_time_ms,
-            data_quality_score=getattr(narrative_data.metadata, 'quality_score', None)
-        )
-        
-        # Set JSON fields
-        if narrative_data.key_insights:
-            narrative.key_insights = [insight.dict() for insight in narrative_data.key_insights]
-        
-        if narrative_data.recommendations:
-            narrative.recommendations = narrative_data.recommendations
-        
-        if narrative_data.sections:
-            narrative.sections = [section.dict() for section in narrative_data.sections]
-        
-        if narrative_data.metadata:
-            narrative.metadata = narrative_data.metadata.dict()
-        
+        narrative = Narrative(**self._narrative_values(narrative_data, csv_file_id, user_id))
         db.add(narrative)
         db.commit()
-        db.refresh(narrative)
-        
+        # No refresh: attributes expired by the commit reload on first access, if any
         return narrative
     
+    def bulk_create_narratives(
+        self,
+        db: Session,
+        narrative_datas: List[NarrativeResponse],
+        csv_file_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+        tags: Optional[List[str]] = None
+    ) -> List[Tuple[int, datetime]]:
+        """
+        Insert narratives (and their tags) with one multi-row INSERT per table and
+        return (id, created_at) for each, in input order, without reloading the rows.
+        """
+        if not narrative_datas:
+            return []
+        
+        rows = [self._narrative_values(data, csv_file_id, user_id) for data in narrative_datas]
+        created = db.execute(
+            insert(Narrative).returning(Narrative.id, Narrative.created_at, sort_by_parameter_order=True),
+            rows
+        ).all()
+        
+        names = Narrative.normalize_tags(tags or [])
+        if names:
+            db.execute(insert(NarrativeTag), [
+                {'narrative_id': narrative_id, 'name': name, 'position': position}
+                for narrative_id, _ in created
+                for position, name in enumerate(names)
+            ])
+        db.commit()
+        return [tuple(row) for row in created]
+    
     def get_narrative(self, db: Session, narrative_id: int) -> Optional[Narrative]:
         """Get a narrative by ID."""
-        return db.query(Narrative).filter(Narrative.id == narrative_id).first()
+        return db.get(Narrative, narrative_id)
     
     def get_narratives(
         self, 
@@ -69,11 +163,75 @@ class NarrativeCRUD:
         limit: int = 20,
         offset: int = 0,
         order_by: str = "created_at",
-        order_desc: bool = True
+        order_desc: bool = True,
+        cursor: Optional[str] = None
     ) -> List[Narrative]:
-        """Get narratives with filtering and pagination."""
-        
-        query = db.query(Narrative)
+        """
+        Get narratives with filtering and pagination.
+        With a cursor (see encode_cursor) the page starts after that row and offset is ignored.
+        """
+        
+        query = self._filter_narratives(
+            db.query(Narrative).options(SUMMARY_LOAD), user_id, csv_file_id, narrative_type,
+            is_favorite, is_archived, tags, order_by, order_desc
+        )
+        return self._paginate(query, limit, offset, order_by, order_desc, cursor).all()
+    
+    def get_narrative_summaries(
+        self, 
+        db: Session, 
+        user_id: Optional[int] = None,
+        csv_file_id: Optional[int] = None,
+        narrative_type: Optional[str] = None,
+        is_favorite: Optional[bool] = None,
+        is_archived: Optional[bool] = None,
+        tags: Optional[List[str]] = None,
+        limit: int = 20,
+        offset: int = 0,
+        order_by: str = "created_at",
+        order_desc: bool = True,
+        cursor: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Same filtering and pagination as get_narratives, but selects only
+        SUMMARY_COLUMNS plus a "tags" list and returns plain dicts instead of ORM instances."""
+        
+        stmt = self._filter_narratives(
+            select(*SUMMARY_COLUMNS), user_id, csv_file_id, narrative_type,
+            is_favorite, is_archived, tags, order_by, order_desc
+        )
+        stmt = self._paginate(stmt, limit, offset, order_by, order_desc, cursor)
+        rows = db.execute(stmt).mappings().all()
+        tags_by_id = self._tags_by_narrative(db, [row["id"] for row in rows])
+        return [{**row, "tags": tags_by_id.get(row["id"], [])} for row in rows]
+    
+    @staticmethod
+    def _tags_by_narrative(db: Session, narrative_ids: List[int]) -> Dict[int, List[str]]:
+        """Tags for a page of narratives in one query, each list in the order the tags were given."""
+        if not narrative_ids:
+            return {}
+        stmt = (
+            select(NarrativeTag.narrative_id, NarrativeTag.name)
+            .where(NarrativeTag.narrative_id.in_(narrative_ids))
+            .order_by(NarrativeTag.narrative_id, NarrativeTag.position)
+        )
+        tags_by_id: Dict[int, List[str]] = {}
+        for narrative_id, name in db.execute(stmt):
+            tags_by_id.setdefault(narrative_id, []).append(name)
+        return tags_by_id
+    
+    @staticmethod
+    def _filter_narratives(
+        query,
+        user_id: Optional[int],
+        csv_file_id: Optional[int],
+        narrative_type: Optional[str],
+        is_favorite: Optional[bool],
+        is_archived: Optional[bool],
+        tags: Optional[List[str]],
+        order_by: str,
+        order_desc: bool
+    ):
+        """Apply listing filters and ordering to an ORM Query or a Core Select."""
         
         # Apply filters
         if user_id is not None:
@@ -92,85 +250,113 @@ class NarrativeCRUD:
             query = query.filter(Narrative.is_archived == is_archived)
         
         if tags:
-            # Filter by tags (OR condition for any matching tag)
-            tag_conditions = []
-            for tag in tags:
-                tag_conditions.append(Narrative.tags.contains(tag))
-            query = query.filter(or_(*tag_conditions))
-        
-        # Apply ordering
-        if hasattr(Narrative, order_by):
-            order_column = getattr(Narrative, order_by)
-            if order_desc:
-                query = query.order_by(desc(order_column))
-            else:
-                query = query.order_by(asc(order_column))
-        
-        # Apply pagination
-        return query.offset(offset).limit(limit).all()
+            # Narratives having any of the tags (exact match), via the narrative_tags name index
+            tagged = select(NarrativeTag.narrative_id).where(
+                NarrativeTag.name.in_(Narrative.normalize_tags(tags))
+            )
+            query = query.filter(Narrative.id.in_(tagged))
+        
+        # Apply ordering; id breaks ties so pages are stable
+        direction = desc if order_desc else asc
+        order_column = ORDERABLE_COLUMNS.get(order_by, Narrative.created_at)
+        query = query.order_by(direction(order_column))
+        if order_column is not Narrative.id:
+            query = query.order_by(direction(Narrative.id))
+        
+        return query
+    
+    @staticmethod
+    def _paginate(query, limit: int, offset: int, order_by: str, order_desc: bool, cursor: Optional[str]):
+        """
+        Apply a page window to an ordered listing query. A cursor seeks past the
+        last row of the previous page via the (created_at, id) index instead of
+        scanning and discarding offset rows; it is only valid for created_at ordering.
+        """
+        if cursor is None:
+            return query.offset(offset).limit(limit)
+        if order_by != "created_at":
+            raise ValueError("Cursor pagination requires order_by=created_at")
+        
+        created_at, narrative_id = decode_cursor(cursor)
+        key = tuple_(Narrative.created_at, Narrative.id)
+        boundary = tuple_(created_at, narrative_id)
+        return query.filter(key < boundary if order_desc else key > boundary).limit(limit)
     
     def update_narrative(
         self, 
         db: Session, 
         narrative_id: int, 
         update_data: Dict[str, Any]
-    ) -> Optional[Narrative]:
-        """Update a narrative."""
+    ) -> Optional[datetime]:
+        """
+        Update a narrative and return its new updated_at, or None if it doesn't exist.
+        Plain column changes are a single UPDATE ... RETURNING; tags and key insights
+        go through the model, since setting them also maintains derived state.
+        """
+        
+        fields = {field: value for field, value in update_data.items() if field in UPDATABLE_FIELDS}
+        if not fields.keys() & MODEL_UPDATED_FIELDS:
+            if not fields:
+                return db.execute(
+                    select(Narrative.updated_at).where(Narrative.id == narrative_id)
+                ).scalar_one_or_none()
+            updated_at = db.execute(
+                update(Narrative)
+                .where(Narrative.id == narrative_id)
+                .values(**fields)
+                .returning(Narrative.updated_at)
+            ).scalar_one_or_none()
+            db.commit()
+            return updated_at
         
         narrative = self.get_narrative(db, narrative_id)
         if not narrative:
             return None
         
-        # Update allowed fields
-        allowed_fields = [
-            'title', 'summary', 'content', 'is_favorite', 
-            'is_archived', 'tags', 'key_insights', 'recommendations'
-        ]
-        
-        for field, value in update_data.items():
-            if field in allowed_fields and hasattr(narrative, field):
+        for field, value in fields.items():
+            if field == 'tags':
+                narrative.tag_list = value
+            else:
                 setattr(narrative, field, value)
         
         db.commit()
-        db.refresh(narrative)
-        
-        return narrative
+        return narrative.updated_at
     
     def delete_narrative(self, db: Session, narrative_id: int) -> bool:
-        """Delete a narrative."""
+        """Delete a narrative with plain DELETEs; the rowcount tells whether it existed."""
         
-        narrative = self.get_narrative(db, narrative_id)
-        if not narrative:
-            return False
-        
-        db.delete(narrative)
+        # Tags are removed explicitly since SQLite doesn't enforce the ON DELETE CASCADE by default
+        db.execute(delete(NarrativeTag).where(NarrativeTag.narrative_id == narrative_id))
+        deleted = db.execute(delete(Narrative).where(Narrative.id == narrative_id)).rowcount
         db.commit()
         
-        return True
+        return deleted > 0
     
     def toggle_favorite(self, db: Session, narrative_id: int) -> Optional[bool]:
-        """Toggle favorite status of a narrative."""
-        
-        narrative = self.get_narrative(db, narrative_id)
-        if not narrative:
-            return None
-        
-        narrative.is_favorite = not narrative.is_favorite
+        """Toggle favorite status of a narrative in one UPDATE ... RETURNING."""
+        
+        is_favorite = db.execute(
+            update(Narrative)
+            .where(Narrative.id == narrative_id)
+            .values(is_favorite=not_(Narrative.is_favorite))
+            .returning(Narrative.is_favorite)
+        ).scalar_one_or_none()
         db.commit()
         
-        return narrative.is_favorite
+        return is_favorite
     
     def archive_narrative(self, db: Session, narrative_id: int, archive: bool = True) -> Optional[bool]:
-        """Archive or unarchive a narrative."""
-        
-        narrative = self.get_narrative(db, narrative_id)
-        if not narrative:
-            return None
-        
-        narrative.is_archived = archive
+        """Archive or unarchive a narrative in one UPDATE ... RETURNING."""
+        
+        is_archived = db.execute(
+            update(Narrative)
+            .where(Narrative.id == narrative_id)
+            .values(is_archived=archive)
+            .returning(Narrative.is_archived)
+        ).scalar_one_or_none()
         db.commit()
         
-        return narrative.is_archived
+        return is_archived
     
     def search_narratives(
         self, 
@@ -181,16 +367,19 @@ class NarrativeCRUD:
     ) -> List[Narrative]:
         """Search narratives by title, summary, or content."""
         
-        query = db.query(Narrative)
+        # Results are rendered as summaries without tags, so skip the tag query too
+        query = db.query(Narrative).options(SUMMARY_LOAD, lazyload(Narrative.tag_rows))
         
         if user_id is not None:
             query = query.filter(Narrative.user_id == user_id)
         
-        # Search in title, summary, and content
+        # Case-insensitive substring match in title, summary, and content. On Postgres
+        # ILIKE '%q%' is served by the pg_trgm GIN indexes from migration 0007.
+        pattern = "%" + _escape_like(search_query) + "%"
         search_filter = or_(
-            Narrative.title.contains(search_query),
-            Narrative.summary.contains(search_query),
-            Narrative.content.contains(search_query)
+            Narrative.title.ilike(pattern, escape="\\"),
+            Narrative.summary.ilike(pattern, escape="\\"),
+            Narrative.content.ilike(pattern, escape="\\")
         )
         
         query = query.filter(search_filter)
@@ -199,38 +388,54 @@ class NarrativeCRUD:
         return query.limit(limit).all()
     
     def get_narrative_stats(self, db: Session, user_id: Optional[int] = None) -> Dict[str, Any]:
-        """Get statistics about narratives."""
-        
-        query = db.query(Narrative)
-        
+        """
+        Get statistics about narratives.
+        Counts and insight averages come from one grouped aggregate query and
+        top tags from a second, grouped over narrative_tags.
+        """
+        
+        with_insights = Narrative.insights_count > 0
+        stmt = select(
+            Narrative.narrative_type,
+            func.count(),
+            func.count(case((Narrative.is_favorite.is_(True), 1))),
+            func.count(case((Narrative.is_archived.is_(True), 1))),
+            func.count(case((with_insights, 1))),
+            func.coalesce(func.sum(case((with_insights, Narrative.insights_count))), 0),
+        ).group_by(Narrative.narrative_type)
+        uses = func.count().label("uses")
+        tags_stmt = (
+            select(NarrativeTag.name, uses)
+            .group_by(NarrativeTag.name)
+            .order_by(desc(uses), NarrativeTag.name)
+            .limit(10)
+        )
         if user_id is not None:
-            query = query.filter(Narrative.user_id == user_id)
-        
-        total_count = query.count()
-        favorites_count = query.filter(Narrative.is_favorite == True).count()
-        archived_count = query.filter(Narrative.is_archived == True).count()
+            stmt = stmt.where(Narrative.user_id == user_id)
+            tags_stmt = tags_stmt.join(Narrative, Narrative.id == NarrativeTag.narrative_id).where(
+                Narrative.user_id == user_id
+            )
         
-        # Count by narrative type
+        total_count = favorites_count = archived_count = 0
+        insight_narratives = insight_total = 0
         type_counts = {}
-        for narrative_type in ['statistical_test', 'data_summary', 'visualization']:
-            count = query.filter(Narrative.narrative_type == narrative_type).count()
-            if count > 0:
-                type_counts[narrative_type] = count
-        
-        # Average insights per narrative
-        narratives_with_insights = query.filter(Narrative.insights_count > 0).all()
-        avg_insights = 0
-        if narratives_with_insights:
-            avg_insights = sum(n.insights_count for n in narratives_with_insights) / len(narratives_with_insights)
+        for narrative_type, count, favorites, archived, with_insights_count, insights in db.execute(stmt):
+            total_count += count
+            favorites_count += favorites
+            archived_count += archived
+            insight_narratives += with_insights_count
+            insight_total += insights
+            type_counts[narrative_type] = count
+        # Known types first in their fixed order, then any others by name
+        type_order = [t for t in NARRATIVE_STAT_TYPES if t in type_counts]
+        type_order += sorted(set(type_counts) - set(NARRATIVE_STAT_TYPES))
+        type_counts = {t: type_counts[t] for t in type_order}
+        
+        # Average insights per narrative that has any
+        avg_insights = insight_total / insight_narratives if insight_narratives else 0
         
         # Most used tags
-        all_narratives = query.filter(Narrative.tags.isnot(None)).all()
-        tag_counts = {}
-        for narrative in all_narratives:
-            for tag in narrative.tag_list:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
-        
-        top_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_tags = [(name, count) for name, count in db.execute(tags_stmt)]
         
         return {
             'total_narratives': total_count,
@@ -241,6 +446,16 @@ class NarrativeCRUD:
             'top_tags': top_tags
         }
     
+    def get_stats_version(self, db: Session, user_id: Optional[int] = None) -> tuple:
+        """
+        Cheap fingerprint of the rows behind get_narrative_stats: (COUNT(*), MAX(updated_at)).
+        Inserts and deletes change the count and updates bump updated_at.
+        """
+        stmt = select(func.count(Narrative.id), func.max(Narrative.updated_at))
+        if user_id is not None:
+            stmt = stmt.where(Narrative.user_id == user_id)
+        return tuple(db.execute(stmt).one())
+    
     def get_recent_narratives(
         self, 
         db: Session, 
@@ -249,7 +464,7 @@ class NarrativeCRUD:
     ) -> List[Narrative]:
         """Get recently created narratives."""
         
-        query = db.query(Narrative)
+        query = db.query(Narrative).options(SUMMARY_LOAD)
         
         if user_id is not None:
             query = query.filter(Narrative.user_id == user_id)
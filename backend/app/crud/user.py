@@ -3,11 +3,12 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from app.core.security import get_password_hash, verify_password
+from app.crud import user_cache
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 
 def get(db: Session, id: int) -> Optional[User]:
-    return db.query(User).filter(User.id == id).first()
+    return db.get(User, id)
 
 def get_by_email(db: Session, email: str) -> Optional[User]:
     return db.query(User).filter(User.email == email).first()
@@ -39,6 +40,7 @@ def update(
     db.add(db_obj)
     db.commit()
     db.refresh(db_obj)
+    user_cache.invalidate(db_obj.id)
     return db_obj
 
 def authenticate(
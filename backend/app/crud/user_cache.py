@@ -0,0 +1,40 @@
+import threading
+from typing import Optional
+
+from cachetools import TTLCache
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.models.user import User
+
+
+# Column snapshots of recently authenticated users keyed by user id. crud.user.update
+# drops a user's entry, so the TTL only bounds changes made outside this process
+_cache = TTLCache(maxsize=5000, ttl=60)
+_cache_lock = threading.Lock()
+
+def get_cached(db: Session, id: int) -> Optional[User]:
+    """Return the user, attaching a cached snapshot to this session when possible.
+    Missing users are not cached."""
+    with _cache_lock:
+        snapshot = _cache.get(id)
+    if snapshot is not None:
+        # Rebuild a detached instance and attach it without emitting a SELECT
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    user = db.get(User, id)
+    if user is not None:
+        snapshot = {
+            attr.key: getattr(user, attr.key)
+            for attr in inspect(User).column_attrs
+        }
+        with _cache_lock:
+            _cache[id] = snapshot
+    return user
+
+def invalidate(id: int) -> None:
+    """Drop a user from the auth cache, e.g. after it was updated."""
+    with _cache_lock:
+        _cache.pop(id, None)
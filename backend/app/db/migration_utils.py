@@ -0,0 +1,24 @@
+from typing import Any, Dict, Sequence
+
+from alembic import op
+from sqlalchemy import Table
+
+DEFAULT_BATCH_SIZE = 10000
+
+def bulk_insert(
+    table: Table, rows: Sequence[Dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE
+) -> int:
+    """Insert rows from a data migration in executemany batches.
+
+    Each batch is sent as a single INSERT with many parameter sets instead of
+    one statement per row. Alembic already wraps every revision in a
+    transaction, so all batches commit (or roll back) together.
+    Returns the number of rows inserted.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    bind = op.get_bind()
+    for start in range(0, len(rows), batch_size):
+        bind.execute(table.insert(), list(rows[start:start + batch_size]))
+    return len(rows)
@@ -3,7 +3,19 @@ from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _orjson_dumps(value) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# JSON/JSONB columns (narrative insights, sections, ...) are encoded with orjson when installed
+json_options = {"json_serializer": _orjson_dumps, "json_deserializer": orjson.loads} if orjson else {}
+engine = create_engine(settings.DATABASE_URL, **json_options)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def get_db():
@@ -11,4 +23,4 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
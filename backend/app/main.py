@@ -1,12 +1,32 @@
-from fastapi import FastAPI
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
 
 from app.core.config import settings
 from app.api.v1.api import api_router
+from app.core.workers import get_executor, shutdown_executor, start_process_pool
+from app.services.narrative_service import close_http_session, precompile_templates
+
+logger = logging.getLogger(__name__)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    precompile_templates()
+    get_executor()
+    start_process_pool()
+    yield
+    close_http_session()
+    shutdown_executor()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url="/api/v1/openapi.json"
+    openapi_url="/api/v1/openapi.json",
+    lifespan=lifespan
 )
 
 # Set up CORS middleware
@@ -16,6 +36,22 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+# Chart payloads run to megabytes of coordinates; level 6 trades a little ratio for far less CPU than the default 9.
+# NDJSON streams (/narratives/batch/stream) are excluded so each line is sent as soon as it is ready
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=1024,
+    compresslevel=6,
+    exclude_content_types=(*DEFAULT_EXCLUDED_CONTENT_TYPES, "application/x-ndjson"),
+)
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    # Endpoints only catch the errors they can describe; anything else lands here
+    logger.error(f"Unhandled error on {request.method} {request.url.path}: {str(exc)}", exc_info=exc)
+    return JSONResponse(status_code=500, content={"detail": "Internal server error"})
+
 app.include_router(api_router, prefix="/api/v1")
\ No newline at end of file
@@ -1,5 +1,6 @@
 from app.models.user import User
 from app.models.csv_file import CSVFile
+from app.models.narrative import Narrative, NarrativeTag
 
 # This helps SQLAlchemy understand relationships between models
-__all__ = ["User", "CSVFile"]
\ No newline at end of file
+__all__ = ["User", "CSVFile", "Narrative", "NarrativeTag"]
\ No newline at end of file
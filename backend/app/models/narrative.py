@@ -2,16 +2,30 @@
 SQLAlchemy model for narrative storage
 """
 
-import json
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, Boolean, Float
-from sqlalchemy.orm import relationship
+from typing import Iterable, List, Optional, Dict, Any
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String, Text, Boolean, Float
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, validates
 
 from app.db.base import Base
 
+# none_as_null keeps empty fields as SQL NULL rather than a JSON null literal
+JSONType = JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql")
+
+
 class Narrative(Base):
     __tablename__ = "narratives"
+    # Listing indexes: each serves a filter plus the (created_at, id) order used for paging
+    __table_args__ = (
+        Index("ix_narratives_created_id", "created_at", "id"),
+        Index("ix_narratives_user_created_id", "user_id", "created_at", "id"),
+        Index("ix_narratives_user_archived_created_id", "user_id", "is_archived", "created_at", "id"),
+        Index("ix_narratives_user_type_created_id", "user_id", "narrative_type", "created_at", "id"),
+        Index("ix_narratives_csv_file_created_id", "csv_file_id", "created_at", "id"),
+        Index("ix_narratives_type", "narrative_type"),
+        Index("ix_narratives_favorite", "is_favorite"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(500), nullable=False)
@@ -19,12 +33,12 @@ class Narrative(Base):
     content = Column(Text, nullable=False)
     narrative_type = Column(String(50), nullable=False)  # 'statistical_test', 'data_summary', etc.
     
-    # JSON fields stored as TEXT
-    _key_insights = Column("key_insights", Text, nullable=True)
-    _recommendations = Column("recommendations", Text, nullable=True) 
-    _sections = Column("sections", Text, nullable=True)
-    _metadata = Column("metadata", Text, nullable=True)
-    _patterns = Column("patterns", Text, nullable=True)  # AI-detected patterns
+    # Structured fields; JSONB on Postgres, decoded by the driver
+    key_insights = Column(JSONType, nullable=True)
+    recommendations = Column(JSONType, nullable=True)
+    sections = Column(JSONType, nullable=True)
+    extra_metadata = Column("metadata", JSONType, nullable=True)  # "metadata" is reserved on declarative classes
+    patterns = Column(JSONType, nullable=True)  # AI-detected patterns
     
     # Relationships and metadata
     csv_file_id = Column(Integer, ForeignKey("csv_files.id"), nullable=True)
@@ -40,123 +54,57 @@ class Narrative(Base):
     # Storage metadata
     is_favorite = Column(Boolean, nullable=False, default=False)
     is_archived = Column(Boolean, nullable=False, default=False)
-    tags = Column(String(500), nullable=True)  # Comma-separated tags
     
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     # Relationships
-    csv_file = relationship("CSVFile", back_populates="narratives")
-    user = relationship("User", back_populates="narratives")
-    
-    @property
-    def key_insights(self) -> List[Dict[str, Any]]:
-        """Return key insights as a list of dictionaries."""
-        if self._key_insights:
-            try:
-                return json.loads(self._key_insights)
-            except (json.JSONDecodeError, TypeError):
-                return []
-        return []
-    
-    @key_insights.setter
-    def key_insights(self, value: List[Dict[str, Any]]) -> None:
-        """Set key insights, converting to JSON string."""
-        if value:
-            self._key_insights = json.dumps(value)
-            self.insights_count = len(value)
-        else:
-            self._key_insights = None
-            self.insights_count = 0
-    
-    @property
-    def recommendations(self) -> List[str]:
-        """Return recommendations as a list of strings."""
-        if self._recommendations:
-            try:
-                return json.loads(self._recommendations)
-            except (json.JSONDecodeError, TypeError):
-                return []
-        return []
-    
-    @recommendations.setter
-    def recommendations(self, value: List[str]) -> None:
-        """Set recommendations, converting to JSON string."""
-        if value:
-            self._recommendations = json.dumps(value)
-        else:
-            self._recommendations = None
-    
-    @property
-    def sections(self) -> List[Dict[str, Any]]:
-        """Return sections as a list of dictionaries."""
-        if self._sections:
-            try:
-                return json.loads(self._sections)
-            except (json.JSONDecodeError, TypeError):
-                return []
-        return []
-    
-    @sections.setter
-    def sections(self, value: List[Dict[str, Any]]) -> None:
-        """Set sections, converting to JSON string."""
-        if value:
-            self._sections = json.dumps(value)
-        else:
-            self._sections = None
-    
-    @property
-    def metadata(self) -> Dict[str, Any]:
-        """Return metadata as a dictionary."""
-        if self._metadata:
-            try:
-                return json.loads(self._metadata)
-            except (json.JSONDecodeError, TypeError):
-                return {}
-        return {}
-    
-    @metadata.setter
-    def metadata(self, value: Dict[str, Any]) -> None:
-        """Set metadata, converting to JSON string."""
-        if value:
-            self._metadata = json.dumps(value)
-        else:
-            self._metadata = None
-    
-    @property
-    def patterns(self) -> List[Dict[str, Any]]:
-        """Return AI-detected patterns as a list of dictionaries."""
-        if self._patterns:
-            try:
-                return json.loads(self._patterns)
-            except (json.JSONDecodeError, TypeError):
-                return []
-        return []
-    
-    @patterns.setter
-    def patterns(self, value: List[Dict[str, Any]]) -> None:
-        """Set patterns, converting to JSON string."""
-        if value:
-            self._patterns = json.dumps(value)
-            self.patterns_count = len(value)
-        else:
-            self._patterns = None
-            self.patterns_count = 0
+    # lazy="raise": nothing reads these per row today; a caller that needs them must
+    # eager-load (selectinload) rather than trigger one SELECT per narrative
+    csv_file = relationship("CSVFile", back_populates="narratives", lazy="raise")
+    user = relationship("User", back_populates="narratives", lazy="raise")
+    # Tags live in narrative_tags so filters and tag counts can use an index; see tag_list
+    tag_rows = relationship(
+        "NarrativeTag",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
+        order_by="NarrativeTag.position"
+    )
+    
+    @validates("key_insights")
+    def _count_insights(self, key: str, value: Optional[List[Dict[str, Any]]]) -> Optional[List[Dict[str, Any]]]:
+        self.insights_count = len(value) if value else 0
+        return value or None
+    
+    @validates("patterns")
+    def _count_patterns(self, key: str, value: Optional[List[Dict[str, Any]]]) -> Optional[List[Dict[str, Any]]]:
+        self.patterns_count = len(value) if value else 0
+        return value or None
+    
+    @staticmethod
+    def normalize_tags(tags: Iterable[str]) -> List[str]:
+        """Strip tags and drop empty and repeated ones, keeping first-seen order."""
+        return list(dict.fromkeys(tag.strip() for tag in tags if tag and tag.strip()))
     
     @property
     def tag_list(self) -> List[str]:
         """Return tags as a list of strings."""
-        if self.tags:
-            return [tag.strip() for tag in self.tags.split(',') if tag.strip()]
-        return []
+        return [row.name for row in self.tag_rows]
     
     @tag_list.setter
-    def tag_list(self, value: List[str]) -> None:
+    def tag_list(self, value: Optional[List[str]]) -> None:
         """Set tags from a list of strings."""
-        if value:
-            self.tags = ', '.join(value)
-        else:
-            self.tags = None
+        # Reuse rows for tags that stay so the flush doesn't delete and re-insert the same key
+        existing = {row.name: row for row in self.tag_rows}
+        rows = []
+        for position, name in enumerate(self.normalize_tags(value or [])):
+            row = existing.get(name) or NarrativeTag(name=name)
+            row.position = position
+            rows.append(row)
+        self.tag_rows = rows
+        # Tag changes don't touch the narratives row, so bump updated_at explicitly
+        self.updated_at = datetime.utcnow()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert narrative to dictionary for API responses."""
@@ -166,12 +114,12 @@ class Narrative(Base):
             'summary': self.summary,
             'content': self.content,
             'narrative_type': self.narrative_type,
-            'key_insights': self.key_insights,
-            'recommendations': self.recommendations,
-            'sections': self.sections,
-            'patterns': self.patterns,
+            'key_insights': self.key_insights or [],
+            'recommendations': self.recommendations or [],
+            'sections': self.sections or [],
+            'patterns': self.patterns or [],
             'metadata': {
-                **self.metadata,
+                **(self.extra_metadata or {}),
                 'generation_method': self.generation_method,
                 'generation_time_ms': self.generation_time_ms,
                 'data_quality_score': self.data_quality_score,
@@ -187,4 +135,20 @@ class Narrative(Base):
         }
     
     def __repr__(self) -> str:
-        return f"<Narrative(id={self.id}, title='{self.title[:50]}...', type={self.narrative_type})>"
\ No newline at end of file
+        return f"<Narrative(id={self.id}, title='{self.title[:50]}...', type={self.narrative_type})>"
+
+
+class NarrativeTag(Base):
+    """One tag on one narrative. Indexed by name so tag filters avoid scanning narratives."""
+    __tablename__ = "narrative_tags"
+    
+    narrative_id = Column(Integer, ForeignKey("narratives.id", ondelete="CASCADE"), primary_key=True)
+    name = Column(String(500), primary_key=True)
+    position = Column(Integer, nullable=False, default=0)  # Order the tags were given in
+    
+    __table_args__ = (
+        Index("ix_narrative_tags_name", "name", "narrative_id"),
+    )
+    
+    def __repr__(self) -> str:
+        return f"<NarrativeTag(narrative_id={self.narrative_id}, name='{self.name}')>"
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 class CSVFileBase(BaseModel):
     filename: str
@@ -21,8 +21,7 @@ class CSVFile(CSVFileBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class CSVUploadResponse(BaseModel):
     file: CSVFile
@@ -1,5 +1,5 @@
-from typing import Optional, List, Dict, Any, Union
-from pydantic import BaseModel, Field
+from typing import Annotated, Optional, List, Dict, Any, Union
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag
 from datetime import datetime
 from enum import Enum
 
@@ -61,8 +61,8 @@ class StatisticalTestNarrativeRequest(NarrativeRequest):
     columns: Optional[List[str]] = Field(default_factory=list, description="Columns involved in the test")
     group_statistics: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Descriptive statistics by group")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "narrative_type": "statistical_test",
                 "test_name": "Independent T-Test",
@@ -82,6 +82,7 @@ class StatisticalTestNarrativeRequest(NarrativeRequest):
                 }
             }
         }
+    )
 
 
 class DataSummaryNarrativeRequest(NarrativeRequest):
@@ -106,6 +107,36 @@ class VisualizationNarrativeRequest(NarrativeRequest):
     patterns_detected: Optional[List[str]] = Field(default_factory=list, description="Patterns detected in the visualization")
 
 
+def _narrative_type_tag(value: Any) -> Optional[str]:
+    """Discriminator for template test bodies: the raw narrative_type value."""
+    if isinstance(value, dict):
+        narrative_type = value.get("narrative_type")
+    else:
+        narrative_type = getattr(value, "narrative_type", None)
+    return getattr(narrative_type, "value", narrative_type)
+
+
+# Body of /test-template: validated once, straight into the model matching narrative_type
+TemplateTestNarrativeRequest = Annotated[
+    Union[
+        Annotated[StatisticalTestNarrativeRequest, Tag(NarrativeType.STATISTICAL_TEST.value)],
+        Annotated[DataSummaryNarrativeRequest, Tag(NarrativeType.DATA_SUMMARY.value)],
+    ],
+    Discriminator(_narrative_type_tag),
+]
+
+# One item of a batch: dispatched on narrative_type like TemplateTestNarrativeRequest,
+# instead of trying each request model in turn
+AnyNarrativeRequest = Annotated[
+    Union[
+        Annotated[StatisticalTestNarrativeRequest, Tag(NarrativeType.STATISTICAL_TEST.value)],
+        Annotated[DataSummaryNarrativeRequest, Tag(NarrativeType.DATA_SUMMARY.value)],
+        Annotated[VisualizationNarrativeRequest, Tag(NarrativeType.VISUALIZATION.value)],
+    ],
+    Discriminator(_narrative_type_tag),
+]
+
+
 # Insight and finding models
 class Insight(BaseModel):
     """Individual insight or finding"""
@@ -151,8 +182,8 @@ class NarrativeResponse(BaseModel):
     recommendations: List[str] = Field(default_factory=list, description="Action recommendations")
     metadata: NarrativeMetadata = Field(..., description="Generation metadata")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "narrative_type": "statistical_test",
                 "title": "T-Test Analysis Results",
@@ -186,11 +217,22 @@ class NarrativeResponse(BaseModel):
                 }
             }
         }
+    )
+
+
+# Error models
+class NarrativeError(BaseModel):
+    """Error response for narrative generation"""
+    error_type: str = Field(..., description="Type of error that occurred")
+    error_message: str = Field(..., description="Human-readable error message")
+    details: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional error details")
+    suggestions: List[str] = Field(default_factory=list, description="Suggestions for fixing the error")
+    fallback_available: bool = Field(False, description="Whether a fallback generation method is available")
 
 
 class BatchNarrativeRequest(BaseModel):
     """Request for generating multiple narratives at once"""
-    requests: List[Union[StatisticalTestNarrativeRequest, DataSummaryNarrativeRequest, VisualizationNarrativeRequest]] = Field(..., description="List of narrative requests")
+    requests: List[AnyNarrativeRequest] = Field(..., description="List of narrative requests")
     global_context: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Global context applied to all narratives")
     combine_insights: bool = Field(False, description="Whether to combine insights across all narratives")
 
@@ -201,6 +243,7 @@ class BatchNarrativeResponse(BaseModel):
     combined_insights: Optional[List[Insight]] = Field(default_factory=list, description="Combined insights across all narratives")
     executive_summary: Optional[str] = Field(None, description="Executive summary combining all narratives")
     total_generation_time_ms: int = Field(..., description="Total time for all generations")
+    errors: List[NarrativeError] = Field(default_factory=list, description="Requests that failed to generate, with their batch index in details")
 
 
 class NarrativeTemplate(BaseModel):
@@ -229,14 +272,4 @@ class NarrativeSettings(BaseModel):
     max_insights: int = Field(5, description="Maximum number of key insights to include")
     enable_ai_generation: bool = Field(True, description="Whether to use AI generation")
     openai_api_key: Optional[str] = Field(None, description="OpenAI API key for cloud AI generation")
-    local_model_path: Optional[str] = Field(None, description="Path to local AI model")
-
-
-# Error models
-class NarrativeError(BaseModel):
-    """Error response for narrative generation"""
-    error_type: str = Field(..., description="Type of error that occurred")
-    error_message: str = Field(..., description="Human-readable error message")
-    details: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional error details")
-    suggestions: List[str] = Field(default_factory=list, description="Suggestions for fixing the error")
-    fallback_available: bool = Field(False, description="Whether a fallback generation method is available")
\ No newline at end of file
+    local_model_path: Optional[str] = Field(None, description="Path to local AI model")
\ No newline at end of file
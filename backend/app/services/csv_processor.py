@@ -1,22 +1,54 @@
-import json
+import codecs
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Tuple, Any
-from fastapi import UploadFile, HTTPException
+from fastapi import UploadFile
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.workers import run_sync
 from app.crud.csv_file import create as create_csv_file
+from app.models.csv_file import CSVFile
 from app.schemas.csv_file import CSVFileCreate
+from app.services.csv_reader import classify_columns, read_csv
 
 UPLOAD_DIR = Path(settings.UPLOAD_DIR)
 PREVIEW_ROWS = 5
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB per read when copying uploads to disk
 MAX_ROWS_FREE_TIER = 1000  # Free tier row limit
+SNIFF_BYTES = 4096
+ALLOWED_CONTENT_TYPES = {
+    "text/csv",
+    "text/plain",
+    "application/csv",
+    "application/vnd.ms-excel",
+    "application/octet-stream",
+}
 
 class CSVProcessingError(Exception):
     pass
 
+async def sniff_csv_upload(file: UploadFile) -> None:
+    """
+    Reject obviously non-CSV uploads before the body is copied or parsed.
+    Checks the declared content type and that the first few KB look like UTF-8 text,
+    then rewinds the file for the caller.
+    """
+    content_type = (file.content_type or "").split(";")[0].strip().lower()
+    if content_type and content_type not in ALLOWED_CONTENT_TYPES:
+        raise CSVProcessingError(f"Unsupported content type '{content_type}' for a CSV upload")
+
+    head = await file.read(SNIFF_BYTES)
+    await file.seek(0)
+    if b"\x00" in head:
+        raise CSVProcessingError("File does not appear to be a text CSV file")
+    try:
+        # Incremental decode so a multi-byte character cut at the boundary is not an error
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        raise CSVProcessingError("CSV files must be UTF-8 encoded")
+
 def get_column_stats(df: pd.DataFrame, column: str) -> Dict[str, Any]:
     """Calculate statistics for a single column."""
     series = df[column]
@@ -37,18 +69,79 @@ def get_column_stats(df: pd.DataFrame, column: str) -> Dict[str, Any]:
     
     return stats
 
+def _analyze_and_register(
+    file_path: Path,
+    unique_filename: str,
+    original_filename: str,
+    user_id: int,
+    db: Session,
+    user_is_premium: bool,
+) -> Tuple[CSVFileCreate, List[Dict[str, Any]], Dict[str, Any], CSVFile]:
+    """Parse a saved upload, validate it and record it. Blocking; run on the worker pool."""
+    # Read CSV with pandas. Free tier uploads only ever need one row past
+    # the limit to be rejected, so don't parse the rest of a large file.
+    nrows = None if user_is_premium else MAX_ROWS_FREE_TIER + 1
+    df = read_csv(file_path, nrows=nrows)
+    
+    # Basic validation
+    if len(df.columns) < 1:
+        raise CSVProcessingError("CSV must have at least one column")
+    
+    if len(df) < 1:
+        raise CSVProcessingError("CSV must have at least one row")
+    
+    # Check row limit for free tier
+    if not user_is_premium and len(df) > MAX_ROWS_FREE_TIER:
+        raise CSVProcessingError(
+            f"Free tier is limited to {MAX_ROWS_FREE_TIER:,} rows. "
+            "Please upgrade to process larger datasets."
+        )
+
+    # Create file info
+    file_info = CSVFileCreate(
+        filename=unique_filename,
+        original_filename=original_filename,
+        row_count=len(df),
+        columns=df.columns.tolist()
+    )
+
+    # Generate preview and statistics
+    preview_data = df.head(PREVIEW_ROWS).to_dict('records')
+    column_stats = {col: get_column_stats(df, col) for col in df.columns}
+    numeric_columns, categorical_columns = classify_columns(df)
+
+    statistics = {
+        'total_rows': len(df),
+        'total_columns': len(df.columns),
+        'columns': column_stats,
+        'numeric_columns': numeric_columns,
+        'categorical_columns': categorical_columns,
+    }
+
+    # Save to database
+    db_file = create_csv_file(
+        db=db,
+        obj_in=file_info,
+        user_id=user_id,
+        file_path=str(file_path)
+    )
+
+    return file_info, preview_data, statistics, db_file
+
 async def process_csv_file(
     file: UploadFile,
     user_id: int,
     db: Session,
     user_is_premium: bool = False,
-) -> Tuple[CSVFileCreate, List[Dict[str, Any]], Dict[str, Any]]:
+) -> Tuple[CSVFileCreate, List[Dict[str, Any]], Dict[str, Any], CSVFile]:
     """
     Process and validate a CSV file.
-    Returns a tuple of (file_info, preview_data, statistics).
+    Returns a tuple of (file_info, preview_data, statistics, db_file) where
+    db_file is the persisted CSVFile record.
     """
     if not file.filename.lower().endswith('.csv'):
         raise CSVProcessingError("File must be a CSV")
+    await sniff_csv_upload(file)
 
     # Create unique filename using timestamp and original name
     unique_filename = f"{user_id}_{Path(file.filename).stem}_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.csv"
@@ -61,7 +154,7 @@ async def process_csv_file(
     file_size = 0
     try:
         with open(file_path, "wb") as buffer:
-            while content := await file.read(8192):
+            while content := await file.read(UPLOAD_CHUNK_SIZE):
                 file_size += len(content)
                 if file_size > MAX_FILE_SIZE:
                     raise CSVProcessingError("File too large (max 50MB)")
@@ -72,51 +165,18 @@ async def process_csv_file(
         raise CSVProcessingError(f"Error saving file: {str(e)}")
 
     try:
-        # Read CSV with pandas
-        df = pd.read_csv(file_path)
-        
-        # Basic validation
-        if len(df.columns) < 1:
-            raise CSVProcessingError("CSV must have at least one column")
-        
-        if len(df) < 1:
-            raise CSVProcessingError("CSV must have at least one row")
-        
-        # Check row limit for free tier
-        if not user_is_premium and len(df) > MAX_ROWS_FREE_TIER:
-            raise CSVProcessingError(
-                f"Free tier is limited to {MAX_ROWS_FREE_TIER:,} rows. "
-                "Please upgrade to process larger datasets."
-            )
-
-        # Create file info
-        file_info = CSVFileCreate(
-            filename=unique_filename,
-            original_filename=file.filename,
-            row_count=len(df),
-            columns=df.columns.tolist()
-        )
-
-        # Generate preview and statistics
-        preview_data = df.head(PREVIEW_ROWS).to_dict('records')
-        statistics = {
-            'total_rows': len(df),
-            'total_columns': len(df.columns),
-            'columns': {
-                col: get_column_stats(df, col)
-                for col in df.columns
-            }
-        }
-
-        # Save to database
-        db_file = create_csv_file(
-            db=db,
-            obj_in=file_info,
-            user_id=user_id,
-            file_path=str(file_path)
+        # Parsing and the insert both block, so keep them off the event loop
+        file_info, preview_data, statistics, db_file = await run_sync(
+            _analyze_and_register,
+            file_path,
+            unique_filename,
+            file.filename,
+            user_id,
+            db,
+            user_is_premium,
         )
 
-        return file_info, preview_data, statistics
+        return file_info, preview_data, statistics, db_file
 
     except pd.errors.EmptyDataError:
         raise CSVProcessingError("The CSV file is empty")
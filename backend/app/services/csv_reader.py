@@ -0,0 +1,56 @@
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def read_csv(file_path: Union[str, Path], nrows: Optional[int] = None) -> pd.DataFrame:
+    """
+    Read a CSV file into a DataFrame.
+    Full reads go through PyArrow's multi-threaded parser when it is installed;
+    bounded reads (nrows) and environments without PyArrow use the default engine.
+    """
+    if PYARROW_AVAILABLE and nrows is None:
+        try:
+            return pd.read_csv(file_path, engine="pyarrow")
+        except pd.errors.ParserError:
+            # PyArrow is stricter (ragged rows) and reports empty files as parse errors;
+            # the default engine gives the same result or error as a bounded read would
+            pass
+    return pd.read_csv(file_path, nrows=nrows)
+
+
+def file_version(file_path: Union[str, Path]) -> Tuple[str, int, int]:
+    """
+    Cache key identifying the current contents of a file on disk.
+    Uploads are never rewritten in place, but mtime and size are included so a
+    replaced file is never served stale results.
+    """
+    stat = os.stat(file_path)
+    return str(file_path), stat.st_mtime_ns, stat.st_size
+
+
+def classify_columns(df: pd.DataFrame) -> Tuple[List[str], List[str]]:
+    """
+    Split columns into (numeric, categorical) names in one pass over the dtypes,
+    without the intermediate frames select_dtypes builds. Numeric means any int,
+    uint or float dtype, nullable ones included; every other column (text, bool,
+    and the timestamps PyArrow infers where the default engine keeps text) is
+    categorical, so both engines classify a file the same way.
+    """
+    numeric: List[str] = []
+    categorical: List[str] = []
+    for col, dtype in df.dtypes.items():
+        if is_numeric_dtype(dtype) and not is_bool_dtype(dtype):
+            numeric.append(col)
+        else:
+            categorical.append(col)
+    return numeric, categorical
@@ -2,11 +2,10 @@ import os
 import uuid
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Tuple
 from fastapi import UploadFile
 from sqlalchemy.orm import Session
 
-from app import crud
 from app.core.config import settings
 from app.schemas.csv_file import CSVFileCreate
 
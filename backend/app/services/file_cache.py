@@ -0,0 +1,57 @@
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar
+
+from cachetools import LRUCache
+
+from app.core.responses import make_etag
+from app.core.workers import run_sync
+from app.services.csv_reader import file_version
+
+T = TypeVar("T")
+
+# Results derived from an uploaded file, keyed by (namespace, *file_version()).
+# Results are shared between requests, so callers must not mutate them.
+_cache = LRUCache(maxsize=512)
+_cache_lock = threading.Lock()
+
+# Computations currently running, so concurrent misses on one key share a single run.
+# Only touched from the event loop thread.
+_inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+
+def cache_key(namespace: str, file_path: str) -> Tuple:
+    return (namespace, *file_version(file_path))
+
+
+def etag_for(namespace: str, file_path: str) -> str:
+    """ETag for a cached result; it changes whenever the file is replaced."""
+    return make_etag(repr(cache_key(namespace, file_path)).encode("utf-8"))
+
+
+def _store(key: Hashable, future: "asyncio.Future[Any]") -> None:
+    _inflight.pop(key, None)
+    if not future.cancelled() and future.exception() is None:
+        with _cache_lock:
+            _cache[key] = future.result()
+
+
+async def get_or_compute(namespace: str, file_path: str, compute: Callable[[str], T]) -> T:
+    """
+    Return compute(file_path), memoized per file version.
+    Misses run compute on the shared worker pool; concurrent misses for the same
+    key wait on the first run instead of parsing the file again. Failures are not cached.
+    """
+    key = cache_key(namespace, file_path)
+    with _cache_lock:
+        result = _cache.get(key)
+    if result is not None:
+        return result
+
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(run_sync(compute, file_path))
+        _inflight[key] = future
+        future.add_done_callback(lambda done: _store(key, done))
+    # Shielded so one caller disconnecting doesn't cancel the run for the others
+    return await asyncio.shield(future)
@@ -6,9 +6,12 @@ Handles template-based and AI-powered narrative generation from statistical resu
 import time
 import hashlib
 import logging
+import json
+import threading
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Union
-from datetime import datetime
-from jinja2 import Environment, BaseLoader, TemplateSyntaxError, UndefinedError
+from cachetools import TTLCache
+from jinja2 import Environment, BaseLoader, Template, TemplateSyntaxError, UndefinedError
 from sqlalchemy.orm import Session
 try:
     import requests
@@ -26,6 +29,37 @@ from app.templates.narrative_templates import NARRATIVE_TEMPLATES, format_p_valu
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session for the custom AI endpoint so connections (and TLS) are kept alive
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session():
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=20)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _http_session = session
+    return _http_session
+
+
+# Successful custom endpoint responses keyed by sha256 of endpoint + payload
+_ai_response_cache = TTLCache(maxsize=1000, ttl=60)
+_ai_response_cache_lock = threading.Lock()
+
+
+def close_http_session() -> None:
+    """Close the shared AI endpoint session; called on application shutdown."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+
 
 class TemplateLoader(BaseLoader):
     """Custom Jinja2 template loader for narrative templates"""
@@ -41,31 +75,63 @@ class TemplateLoader(BaseLoader):
         return source, None, lambda: True
 
 
+@lru_cache(maxsize=1)
+def _jinja_environment() -> Environment:
+    """
+    Process-wide Jinja2 environment for the narrative templates.
+    Shared by every NarrativeService so templates are compiled once and
+    reused from the environment's cache rather than per service instance.
+    """
+    template_dict = {k: v.template_content for k, v in NARRATIVE_TEMPLATES.items()}
+    env = Environment(
+        loader=TemplateLoader(template_dict),
+        trim_blocks=True,
+        lstrip_blocks=True
+    )
+    
+    # Add custom template functions
+    env.globals.update({
+        'format_p_value': format_p_value,
+        'interpret_effect_size': interpret_effect_size,
+        'significance_statement': significance_statement,
+        'abs': abs,
+        'len': len,
+        'max': max,
+        'min': min,
+        'sum': sum
+    })
+    return env
+
+
+@lru_cache(maxsize=1)
+def precompile_templates() -> Dict[str, Template]:
+    """
+    Compile every narrative template once and keep the Template objects, so
+    rendering skips the environment's loader and cache lookups. Templates that
+    fail to compile are left out; rendering them falls back to get_template(),
+    which raises the syntax error as before.
+    """
+    env = _jinja_environment()
+    compiled = {}
+    for key in NARRATIVE_TEMPLATES:
+        try:
+            compiled[key] = env.get_template(key)
+        except TemplateSyntaxError as e:
+            logger.error(f"Narrative template '{key}' failed to compile: {str(e)}")
+    return compiled
+
+
+class NarrativeGenerationError(ValueError):
+    """Raised when a narrative cannot be generated. Subclasses ValueError so
+    existing callers that catch ValueError keep working."""
+
+
 class NarrativeService:
     """Core service for generating data narratives from statistical results"""
     
     def __init__(self, db: Session):
         self.db = db
-        
-        # Initialize Jinja2 environment with custom functions
-        template_dict = {k: v.template_content for k, v in NARRATIVE_TEMPLATES.items()}
-        self.jinja_env = Environment(
-            loader=TemplateLoader(template_dict),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-        
-        # Add custom template functions
-        self.jinja_env.globals.update({
-            'format_p_value': format_p_value,
-            'interpret_effect_size': interpret_effect_size,
-            'significance_statement': significance_statement,
-            'abs': abs,
-            'len': len,
-            'max': max,
-            'min': min,
-            'sum': sum
-        })
+        self.jinja_env = _jinja_environment()
     
     def generate_narrative(
         self, 
@@ -102,12 +168,12 @@ class NarrativeService:
             
         except Exception as e:
             logger.error(f"Failed to generate narrative: {str(e)}", exc_info=True)
-            error_response = self._create_narrative_error(
+            error_response = self.create_narrative_error(
                 "generation_failed",
                 f"Failed to generate narrative: {str(e)}",
                 {"original_error": str(e), "request_type": request.narrative_type}
             )
-            raise ValueError(error_response.error_message)
+            raise NarrativeGenerationError(error_response.error_message)
     
     def _determine_generation_method(self, request: NarrativeRequest) -> GenerationMethod:
         """Determine the best generation method based on request and system configuration"""
@@ -158,10 +224,12 @@ class NarrativeService:
             # Find appropriate template
             template_key = self._find_template_key(request)
             if not template_key:
-                raise ValueError(f"No template found for {request.narrative_type}")
+                raise NarrativeGenerationError(f"No template found for {request.narrative_type}")
             
             template = NARRATIVE_TEMPLATES[template_key]
-            jinja_template = self.jinja_env.get_template(template_key)
+            jinja_template = precompile_templates().get(template_key)
+            if jinja_template is None:
+                jinja_template = self.jinja_env.get_template(template_key)
             
             # Prepare template context
             context = self._prepare_template_context(request)
@@ -175,8 +243,9 @@ class NarrativeService:
             # Generate sections
             sections = self._generate_narrative_sections(content, insights)
             
-            # Create response
-            response = NarrativeResponse(
+            # Create response; every value is built here from the validated request,
+            # so construct without re-running validation
+            response = NarrativeResponse.model_construct(
                 narrative_type=request.narrative_type,
                 title=self._generate_title(request),
                 summary=self._generate_summary(request),
@@ -184,7 +253,7 @@ class NarrativeService:
                 sections=sections,
                 key_insights=insights[:5],  # Limit to top 5 insights
                 recommendations=self._generate_recommendations(request),
-                metadata=NarrativeMetadata(
+                metadata=NarrativeMetadata.model_construct(
                     generation_method=GenerationMethod.TEMPLATE,
                     template_version=template.version,
                     source_data_hash=self._hash_request_data(request)
@@ -195,12 +264,12 @@ class NarrativeService:
             
         except (TemplateSyntaxError, UndefinedError) as e:
             logger.error(f"Template rendering error: {str(e)}")
-            error_response = self._create_narrative_error(
+            error_response = self.create_narrative_error(
                 "template_error",
                 f"Error rendering template: {str(e)}",
                 {"template_key": template_key, "error": str(e)}
             )
-            raise ValueError(error_response.error_message)
+            raise NarrativeGenerationError(error_response.error_message)
     
     def _generate_hybrid_narrative(self, request: NarrativeRequest) -> NarrativeResponse:
         """Generate narrative using hybrid approach (AI + template fallback)"""
@@ -267,24 +336,35 @@ class NarrativeService:
             raise NotImplementedError("Custom AI endpoint requires 'requests' package installation")
         
         try:
-            response = requests.post(
-                endpoint,
-                json={
-                    "narrative_type": request.narrative_type.value if hasattr(request.narrative_type, 'value') else str(request.narrative_type),
-                    "request_data": self._prepare_template_context(request)
-                },
-                timeout=30,
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
+            payload = {
+                "narrative_type": request.narrative_type.value if hasattr(request.narrative_type, 'value') else str(request.narrative_type),
+                "request_data": self._prepare_template_context(request)
+            }
+            cache_key = hashlib.sha256(
+                (endpoint + json.dumps(payload, sort_keys=True, default=str)).encode()
+            ).hexdigest()
+            with _ai_response_cache_lock:
+                response_data = _ai_response_cache.get(cache_key)
+            cached = response_data is not None
             
-            # Parse response - expects NarrativeResponse format
-            response_data = response.json()
+            if not cached:
+                response = _get_http_session().post(
+                    endpoint,
+                    json=payload,
+                    timeout=30,
+                    headers={"Content-Type": "application/json"}
+                )
+                response.raise_for_status()
+                
+                # Parse response - expects NarrativeResponse format
+                response_data = response.json()
+                if not isinstance(response_data, dict):
+                    raise ValueError("Custom AI endpoint returned a non-object JSON body")
             
             # Convert to NarrativeResponse
             from app.schemas.narratives import NarrativeResponse, NarrativeMetadata, GenerationMethod
             
-            return NarrativeResponse(
+            narrative = NarrativeResponse(
                 narrative_type=response_data.get('narrative_type', request.narrative_type),
                 title=response_data.get('title', 'AI-Generated Narrative'),
                 summary=response_data.get('summary', ''),
@@ -297,6 +377,14 @@ class NarrativeService:
                     source_data_hash=self._hash_request_data(request)
                 )
             )
+            
+            # Cache only bodies that validated above; HTTP errors, non-object JSON
+            # and schema failures all raise before reaching this point
+            if not cached:
+                with _ai_response_cache_lock:
+                    _ai_response_cache[cache_key] = response_data
+            
+            return narrative
         except requests.RequestException as e:
             logger.error(f"Custom AI endpoint request failed: {str(e)}")
             raise
@@ -349,13 +437,14 @@ class NarrativeService:
         request: Union[StatisticalTestNarrativeRequest, DataSummaryNarrativeRequest, VisualizationNarrativeRequest]
     ) -> List[Insight]:
         """Extract structured insights from request data"""
+        # Insights are built from already validated request fields, so they skip validation
         
         insights = []
         
         if isinstance(request, StatisticalTestNarrativeRequest):
             # Statistical significance insight
             if request.p_value < 0.05:
-                insights.append(Insight(
+                insights.append(Insight.model_construct(
                     title="Statistically Significant Result",
                     description=f"The test shows a significant result with p = {format_p_value(request.p_value)}",
                     priority=InsightPriority.HIGH,
@@ -367,7 +456,7 @@ class NarrativeService:
             # Effect size insight
             if request.effect_size is not None:
                 magnitude = interpret_effect_size(request.effect_size, request.test_name)
-                insights.append(Insight(
+                insights.append(Insight.model_construct(
                     title=f"{magnitude.title()} Effect Size",
                     description=f"The effect size ({request.effect_size:.3f}) indicates a {magnitude} practical effect",
                     priority=InsightPriority.HIGH if request.effect_size > 0.5 else InsightPriority.MEDIUM,
@@ -379,14 +468,14 @@ class NarrativeService:
             # Data quality insights
             if request.data_quality_score is not None:
                 if request.data_quality_score > 0.9:
-                    insights.append(Insight(
+                    insights.append(Insight.model_construct(
                         title="Excellent Data Quality",
                         description=f"Data quality score of {request.data_quality_score:.1%} indicates excellent dataset readiness",
                         priority=InsightPriority.HIGH,
                         confidence=ConfidenceLevel.HIGH
                     ))
                 elif request.data_quality_score < 0.5:
-                    insights.append(Insight(
+                    insights.append(Insight.model_construct(
                         title="Data Quality Concerns",
                         description=f"Data quality score of {request.data_quality_score:.1%} suggests significant preprocessing needed",
                         priority=InsightPriority.CRITICAL,
@@ -399,7 +488,7 @@ class NarrativeService:
                 total_missing = sum(request.missing_values.values())
                 if total_missing > 0:
                     missing_pct = (total_missing / (request.total_rows * request.total_columns)) * 100
-                    insights.append(Insight(
+                    insights.append(Insight.model_construct(
                         title=f"Missing Values Detected",
                         description=f"{total_missing} missing values ({missing_pct:.1f}% of total data)",
                         priority=InsightPriority.HIGH if missing_pct > 10 else InsightPriority.MEDIUM,
@@ -423,7 +512,7 @@ class NarrativeService:
             if line.startswith('**') and line.endswith('**') and len(line) > 4:
                 # New section header
                 if current_section["content"]:
-                    sections.append(NarrativeSection(
+                    sections.append(NarrativeSection.model_construct(
                         title=current_section["title"],
                         content='\n'.join(current_section["content"]),
                         section_type=current_section["type"],
@@ -443,7 +532,7 @@ class NarrativeService:
         
         # Add final section
         if current_section["content"]:
-            sections.append(NarrativeSection(
+            sections.append(NarrativeSection.model_construct(
                 title=current_section["title"],
                 content='\n'.join(current_section["content"]),
                 section_type=current_section["type"],
@@ -533,7 +622,7 @@ class NarrativeService:
         hash_data = str(request.dict())
         return hashlib.md5(hash_data.encode()).hexdigest()
     
-    def _create_narrative_error(
+    def create_narrative_error(
         self, 
         error_type: str, 
         message: str, 
@@ -1,13 +1,13 @@
 import pandas as pd
 import numpy as np
 from scipy import stats
-from typing import Dict, Any, List, Tuple, Optional
+from typing import List, Optional
 from pathlib import Path
 
-from app.schemas.statistical_tests import (
-    StatisticalTestResult,
-    StatisticalTestError
-)
+from app.core.workers import run_in_process
+from app.services.csv_reader import read_csv
+from app.services.stats_kernels import as_float_array, one_sample_tstat, pooled_tstat
+from app.schemas.statistical_tests import StatisticalTestResult
 
 
 class StatisticalTestsService:
@@ -16,7 +16,7 @@ class StatisticalTestsService:
     @staticmethod
     def _load_data(file_path: str) -> pd.DataFrame:
         """Load CSV data from file path."""
-        return pd.read_csv(Path(file_path))
+        return read_csv(Path(file_path))
     
     @staticmethod
     def _validate_numeric_column(df: pd.DataFrame, column: str) -> List[str]:
@@ -44,17 +44,6 @@ class StatisticalTestsService:
         """Remove NaN values from numeric series."""
         return series.dropna()
     
-    @staticmethod
-    def _calculate_cohens_d(group1: pd.Series, group2: pd.Series) -> float:
-        """Calculate Cohen's d effect size."""
-        n1, n2 = len(group1), len(group2)
-        s1, s2 = group1.std(ddof=1), group2.std(ddof=1)
-        
-        # Pooled standard deviation
-        pooled_std = np.sqrt(((n1 - 1) * s1**2 + (n2 - 1) * s2**2) / (n1 + n2 - 2))
-        
-        return (group1.mean() - group2.mean()) / pooled_std
-    
     @staticmethod
     def _interpret_result(p_value: float, alpha: float, test_name: str, 
                          effect_size: Optional[float] = None) -> str:
@@ -84,8 +73,13 @@ class StatisticalTestsService:
     
     @classmethod
     async def one_sample_ttest(cls, file_path: str, variable_column: str, 
-                              test_value: float, alpha: float = 0.05) -> StatisticalTestResult:
-        """Perform one-sample t-test."""
+                               test_value: float, alpha: float = 0.05) -> StatisticalTestResult:
+        """Perform one-sample t-test. Runs in the stats process pool."""
+        return await run_in_process(cls._one_sample_ttest, file_path, variable_column, test_value, alpha)
+    
+    @classmethod
+    def _one_sample_ttest(cls, file_path: str, variable_column: str, 
+                          test_value: float, alpha: float = 0.05) -> StatisticalTestResult:
         try:
             df = cls._load_data(file_path)
             
@@ -101,20 +95,23 @@ class StatisticalTestsService:
                 raise ValueError(f"Insufficient data: need at least 2 valid values, got {len(data)}")
             
             # Perform test
-            t_stat, p_value = stats.ttest_1samp(data, test_value)
+            t_stat, sample_mean, sample_var, std_error = one_sample_tstat(
+                as_float_array(data), float(test_value)
+            )
+            sample_std = np.sqrt(sample_var)
+            degrees_of_freedom = len(data) - 1
+            p_value = 2 * stats.t.sf(abs(t_stat), degrees_of_freedom)
             
             # Calculate confidence interval
-            confidence_level = 1 - alpha
-            degrees_of_freedom = len(data) - 1
             t_critical = stats.t.ppf(1 - alpha/2, degrees_of_freedom)
-            margin_of_error = t_critical * (data.std(ddof=1) / np.sqrt(len(data)))
-            mean_diff = data.mean() - test_value
+            margin_of_error = t_critical * std_error
+            mean_diff = sample_mean - test_value
             
             ci_lower = mean_diff - margin_of_error
             ci_upper = mean_diff + margin_of_error
             
             # Effect size (Cohen's d for one-sample)
-            effect_size = (data.mean() - test_value) / data.std(ddof=1)
+            effect_size = mean_diff / sample_std
             
             interpretation = cls._interpret_result(p_value, alpha, "one-sample t-test", effect_size)
             
@@ -129,8 +126,8 @@ class StatisticalTestsService:
                 interpretation=interpretation,
                 sample_size=len(data),
                 group_statistics={
-                    "sample_mean": float(data.mean()),
-                    "sample_std": float(data.std(ddof=1)),
+                    "sample_mean": float(sample_mean),
+                    "sample_std": float(sample_std),
                     "test_value": float(test_value)
                 }
             )
@@ -138,10 +135,90 @@ class StatisticalTestsService:
         except Exception as e:
             raise ValueError(f"Error in one-sample t-test: {str(e)}")
     
+    @classmethod
+    async def batch_ttests(cls, file_path: str, variable_columns: List[str],
+                           test_values: List[float], alphas: List[float]) -> List[StatisticalTestResult]:
+        """
+        Perform several one-sample t-tests against one file, loading it once.
+        Results match one_sample_ttest for each (column, test value, alpha) triple.
+        Runs in the stats process pool.
+        """
+        return await run_in_process(cls._batch_ttests, file_path, variable_columns, test_values, alphas)
+    
+    @classmethod
+    def _batch_ttests(cls, file_path: str, variable_columns: List[str],
+                      test_values: List[float], alphas: List[float]) -> List[StatisticalTestResult]:
+        try:
+            df = cls._load_data(file_path)
+            
+            # Validate every column before computing anything
+            columns = list(dict.fromkeys(variable_columns))
+            errors = [error for column in columns for error in cls._validate_numeric_column(df, column)]
+            if errors:
+                raise ValueError("; ".join(errors))
+            
+            # Per-column summary statistics in one pass; NaNs are skipped as in the single test
+            summary = df[columns]
+            counts = summary.count().to_numpy()
+            too_small = [column for column, n in zip(columns, counts) if n < 2]
+            if too_small:
+                raise ValueError(
+                    f"Insufficient data: need at least 2 valid values in {', '.join(too_small)}"
+                )
+            position = {column: i for i, column in enumerate(columns)}
+            idx = np.array([position[column] for column in variable_columns])
+            n = counts[idx].astype(np.float64)
+            sample_mean = summary.mean().to_numpy(dtype=np.float64)[idx]
+            sample_std = summary.std(ddof=1).to_numpy(dtype=np.float64)[idx]
+            test_value = np.asarray(test_values, dtype=np.float64)
+            alpha = np.asarray(alphas, dtype=np.float64)
+            
+            # Perform all tests at once
+            degrees_of_freedom = n - 1
+            std_error = sample_std / np.sqrt(n)
+            mean_diff = sample_mean - test_value
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t_stat = mean_diff / std_error
+                effect_size = mean_diff / sample_std
+            p_value = 2 * stats.t.sf(np.abs(t_stat), degrees_of_freedom)
+            margin_of_error = stats.t.ppf(1 - alpha/2, degrees_of_freedom) * std_error
+            ci_lower = mean_diff - margin_of_error
+            ci_upper = mean_diff + margin_of_error
+            
+            return [
+                StatisticalTestResult(
+                    test_name="One-Sample t-Test",
+                    test_statistic=float(t_stat[i]),
+                    degrees_of_freedom=float(degrees_of_freedom[i]),
+                    p_value=float(p_value[i]),
+                    confidence_interval_lower=float(ci_lower[i]),
+                    confidence_interval_upper=float(ci_upper[i]),
+                    effect_size=float(effect_size[i]),
+                    interpretation=cls._interpret_result(
+                        float(p_value[i]), alphas[i], "one-sample t-test", float(effect_size[i])
+                    ),
+                    sample_size=int(n[i]),
+                    group_statistics={
+                        "sample_mean": float(sample_mean[i]),
+                        "sample_std": float(sample_std[i]),
+                        "test_value": float(test_value[i])
+                    }
+                )
+                for i in range(len(variable_columns))
+            ]
+            
+        except Exception as e:
+            raise ValueError(f"Error in batch one-sample t-tests: {str(e)}")
+    
     @classmethod
     async def independent_ttest(cls, file_path: str, variable_column: str, 
-                               group_column: str, alpha: float = 0.05) -> StatisticalTestResult:
-        """Perform independent samples t-test."""
+                                group_column: str, alpha: float = 0.05) -> StatisticalTestResult:
+        """Perform independent samples t-test. Runs in the stats process pool."""
+        return await run_in_process(cls._independent_ttest, file_path, variable_column, group_column, alpha)
+    
+    @classmethod
+    def _independent_ttest(cls, file_path: str, variable_column: str, 
+                           group_column: str, alpha: float = 0.05) -> StatisticalTestResult:
         try:
             df = cls._load_data(file_path)
             
@@ -166,27 +243,24 @@ class StatisticalTestsService:
             if len(group1_data) < 2 or len(group2_data) < 2:
                 raise ValueError("Each group must have at least 2 valid values")
             
-            # Perform test (equal variance assumed)
-            t_stat, p_value = stats.ttest_ind(group1_data, group2_data, equal_var=True)
+            # Perform test (equal variance assumed); one pass gives t and the pooled standard error
+            t_stat, degrees_of_freedom, mean1, mean2, var1, var2, se_diff = pooled_tstat(
+                as_float_array(group1_data), as_float_array(group2_data)
+            )
+            p_value = 2 * stats.t.sf(abs(t_stat), degrees_of_freedom)
             
             # Calculate confidence interval for difference of means
-            n1, n2 = len(group1_data), len(group2_data)
-            degrees_of_freedom = n1 + n2 - 2
-            
-            # Pooled standard error
-            s1, s2 = group1_data.std(ddof=1), group2_data.std(ddof=1)
-            pooled_var = ((n1 - 1) * s1**2 + (n2 - 1) * s2**2) / degrees_of_freedom
-            se_diff = np.sqrt(pooled_var * (1/n1 + 1/n2))
-            
             t_critical = stats.t.ppf(1 - alpha/2, degrees_of_freedom)
-            mean_diff = group1_data.mean() - group2_data.mean()
+            mean_diff = mean1 - mean2
             margin_of_error = t_critical * se_diff
             
             ci_lower = mean_diff - margin_of_error
             ci_upper = mean_diff + margin_of_error
             
-            # Effect size (Cohen's d)
-            effect_size = cls._calculate_cohens_d(group1_data, group2_data)
+            # Effect size (Cohen's d): difference of means over the pooled standard deviation
+            n1, n2 = len(group1_data), len(group2_data)
+            pooled_std = np.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / degrees_of_freedom)
+            effect_size = mean_diff / pooled_std
             
             interpretation = cls._interpret_result(p_value, alpha, "independent samples t-test", effect_size)
             
@@ -201,11 +275,11 @@ class StatisticalTestsService:
                 interpretation=interpretation,
                 sample_size=len(group1_data) + len(group2_data),
                 group_statistics={
-                    f"group_{groups[0]}_mean": float(group1_data.mean()),
-                    f"group_{groups[0]}_std": float(group1_data.std(ddof=1)),
+                    f"group_{groups[0]}_mean": float(mean1),
+                    f"group_{groups[0]}_std": float(np.sqrt(var1)),
                     f"group_{groups[0]}_n": len(group1_data),
-                    f"group_{groups[1]}_mean": float(group2_data.mean()),
-                    f"group_{groups[1]}_std": float(group2_data.std(ddof=1)),
+                    f"group_{groups[1]}_mean": float(mean2),
+                    f"group_{groups[1]}_std": float(np.sqrt(var2)),
                     f"group_{groups[1]}_n": len(group2_data)
                 }
             )
@@ -215,8 +289,13 @@ class StatisticalTestsService:
     
     @classmethod
     async def paired_ttest(cls, file_path: str, variable1_column: str, 
-                          variable2_column: str, alpha: float = 0.05) -> StatisticalTestResult:
-        """Perform paired samples t-test."""
+                           variable2_column: str, alpha: float = 0.05) -> StatisticalTestResult:
+        """Perform paired samples t-test. Runs in the stats process pool."""
+        return await run_in_process(cls._paired_ttest, file_path, variable1_column, variable2_column, alpha)
+    
+    @classmethod
+    def _paired_ttest(cls, file_path: str, variable1_column: str, 
+                      variable2_column: str, alpha: float = 0.05) -> StatisticalTestResult:
         try:
             df = cls._load_data(file_path)
             
@@ -281,8 +360,13 @@ class StatisticalTestsService:
     
     @classmethod
     async def one_way_anova(cls, file_path: str, variable_column: str, 
-                           group_column: str, alpha: float = 0.05) -> StatisticalTestResult:
-        """Perform one-way ANOVA."""
+                            group_column: str, alpha: float = 0.05) -> StatisticalTestResult:
+        """Perform one-way ANOVA. Runs in the stats process pool."""
+        return await run_in_process(cls._one_way_anova, file_path, variable_column, group_column, alpha)
+    
+    @classmethod
+    def _one_way_anova(cls, file_path: str, variable_column: str, 
+                       group_column: str, alpha: float = 0.05) -> StatisticalTestResult:
         try:
             df = cls._load_data(file_path)
             
@@ -0,0 +1,64 @@
+"""
+Numeric kernels for the t-tests. Compiled with Numba when it is installed;
+otherwise the same functions run as plain NumPy code.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _jit(fn):
+    if numba is None:
+        return fn
+    # error_model="numpy" keeps NumPy's inf/nan results for zero variance instead of raising
+    return numba.njit(cache=True, error_model="numpy")(fn)
+
+
+@_jit
+def _mean_var(x):
+    n = x.size
+    mean = x.sum() / n
+    d = x - mean
+    return mean, (d * d).sum() / (n - 1)
+
+
+@_jit
+def one_sample_tstat(x, test_value):
+    """Return (t, mean, variance, standard error) for a one-sample t-test."""
+    mean, var = _mean_var(x)
+    se = math.sqrt(var / x.size)
+    return (mean - test_value) / se, mean, var, se
+
+
+@_jit
+def pooled_tstat(x, y):
+    """
+    Return (t, df, mean_x, mean_y, var_x, var_y, se_diff) for an independent
+    samples t-test assuming equal variances.
+    """
+    n1 = x.size
+    n2 = y.size
+    m1, v1 = _mean_var(x)
+    m2, v2 = _mean_var(y)
+    df = n1 + n2 - 2
+    pooled_var = ((n1 - 1) * v1 + (n2 - 1) * v2) / df
+    se = math.sqrt(pooled_var * (1.0 / n1 + 1.0 / n2))
+    return (m1 - m2) / se, df, m1, m2, v1, v2, se
+
+
+def as_float_array(series) -> np.ndarray:
+    """Contiguous float64 view of a cleaned numeric series, as the kernels expect."""
+    return np.ascontiguousarray(series.to_numpy(), dtype=np.float64)
+
+
+def warm_up() -> None:
+    """Trigger JIT compilation up front so the first request doesn't pay for it."""
+    sample = np.array([1.0, 2.0, 3.0])
+    one_sample_tstat(sample, 0.0)
+    pooled_tstat(sample, sample + 1.0)
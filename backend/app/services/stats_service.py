@@ -1,21 +1,29 @@
-import pandas as pd
 from typing import Dict, Any
 from pathlib import Path
 
+from app.services import file_cache
+from app.services.csv_reader import classify_columns, read_csv
+
 async def compute_descriptive_stats(file_path: str) -> Dict[str, Any]:
     """
     Compute descriptive statistics for a CSV file.
+    Results are memoized per file version, so repeat requests skip the parse;
+    the returned dict is shared and must not be mutated.
     """
-    df = pd.read_csv(Path(file_path))
+    return await file_cache.get_or_compute("descriptive_stats", file_path, _compute_descriptive_stats)
+
+def _compute_descriptive_stats(file_path: str) -> Dict[str, Any]:
+    df = read_csv(Path(file_path))
+    missing_counts = df.isnull().sum()
+    numeric_cols, cat_cols = classify_columns(df)
     
     stats = {
         "numeric": {},
         "categorical": {},
-        "missing": {k: int(v) for k, v in df.isnull().sum().to_dict().items()}
+        "missing": {k: int(v) for k, v in missing_counts.items()}
     }
     
     # Numeric columns
-    numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns
     if len(numeric_cols) > 0:
         desc = df[numeric_cols].describe()
         for col in numeric_cols:
@@ -31,7 +39,6 @@ async def compute_descriptive_stats(file_path: str) -> Dict[str, Any]:
             }
     
     # Categorical columns (including object type)
-    cat_cols = df.select_dtypes(include=['object', 'category']).columns
     for col in cat_cols:
         value_counts = df[col].value_counts()
         unique_count = len(value_counts)
@@ -44,8 +51,9 @@ async def compute_descriptive_stats(file_path: str) -> Dict[str, Any]:
         }
     
     # Add column types
+    numeric_col_set = set(numeric_cols)
     stats["column_types"] = {
-        col: ("numeric" if col in numeric_cols else "categorical")
+        col: ("numeric" if col in numeric_col_set else "categorical")
         for col in df.columns
     }
     
@@ -56,7 +64,7 @@ async def compute_descriptive_stats(file_path: str) -> Dict[str, Any]:
         "memory_usage": int(df.memory_usage(deep=True).sum()),
         "numeric_columns": int(len(numeric_cols)),
         "categorical_columns": int(len(cat_cols)),
-        "total_missing": int(df.isnull().sum().sum())
+        "total_missing": int(missing_counts.sum())
     }
     
     return stats
\ No newline at end of file
@@ -1,8 +1,9 @@
 import pandas as pd
-import numpy as np
-from typing import Dict, Any, List, Optional, Union
+from typing import List, Optional
 from pathlib import Path
 
+from app.services import file_cache
+from app.services.csv_reader import classify_columns, read_csv
 from app.schemas.visualizations import (
     ChartType,
     ColorScheme,
@@ -29,7 +30,7 @@ class VisualizationService:
     @staticmethod
     def _load_data(file_path: str) -> pd.DataFrame:
         """Load CSV data from file path."""
-        return pd.read_csv(Path(file_path))
+        return read_csv(Path(file_path))
     
     @staticmethod
     def _validate_columns(df: pd.DataFrame, required_columns: List[str], optional_columns: List[str] = None) -> List[str]:
@@ -478,77 +479,82 @@ class VisualizationService:
     
     @classmethod
     async def suggest_charts(cls, file_path: str) -> ChartSuggestionsResponse:
-        """Analyze data and suggest appropriate chart types."""
+        """
+        Analyze data and suggest appropriate chart types.
+        Suggestions depend only on the file contents, so they are memoized per file version.
+        """
         try:
-            df = cls._load_data(file_path)
-            
-            # Analyze columns
-            numeric_columns = df.select_dtypes(include=['int64', 'float64']).columns.tolist()
-            categorical_columns = df.select_dtypes(include=['object', 'category']).columns.tolist()
-            
-            column_analysis = {
-                'total_columns': len(df.columns),
-                'numeric_columns': len(numeric_columns),
-                'categorical_columns': len(categorical_columns),
-                'total_rows': len(df),
-                'numeric_column_names': numeric_columns,
-                'categorical_column_names': categorical_columns
-            }
-            
-            suggestions = []
-            
-            # Scatter plot suggestions
-            if len(numeric_columns) >= 2:
-                suggestions.append(ChartSuggestion(
-                    chart_type=ChartType.SCATTER,
-                    confidence=0.9,
-                    reason="Multiple numeric columns available for correlation analysis",
-                    required_columns=numeric_columns[:2],
-                    optional_columns=categorical_columns + numeric_columns[2:]
-                ))
-            
-            # Histogram suggestions
-            if len(numeric_columns) >= 1:
-                suggestions.append(ChartSuggestion(
-                    chart_type=ChartType.HISTOGRAM,
-                    confidence=0.8,
-                    reason="Numeric columns available for distribution analysis",
-                    required_columns=numeric_columns[:1],
-                    optional_columns=categorical_columns
-                ))
-            
-            # Boxplot suggestions
-            if len(numeric_columns) >= 1:
-                confidence = 0.9 if len(categorical_columns) >= 1 else 0.7
-                reason = "Numeric columns available for distribution analysis"
-                if len(categorical_columns) >= 1:
-                    reason += " with categorical grouping available"
-                
-                suggestions.append(ChartSuggestion(
-                    chart_type=ChartType.BOXPLOT,
-                    confidence=confidence,
-                    reason=reason,
-                    required_columns=numeric_columns[:1],
-                    optional_columns=categorical_columns
-                ))
-            
-            # Bar chart suggestions
-            if len(categorical_columns) >= 1 and len(numeric_columns) >= 1:
-                suggestions.append(ChartSuggestion(
-                    chart_type=ChartType.BAR,
-                    confidence=0.8,
-                    reason="Categorical and numeric columns available for aggregated comparison",
-                    required_columns=[categorical_columns[0], numeric_columns[0]],
-                    optional_columns=categorical_columns[1:] + numeric_columns[1:]
-                ))
-            
-            # Sort by confidence
-            suggestions.sort(key=lambda x: x.confidence, reverse=True)
-            
-            return ChartSuggestionsResponse(
-                suggestions=suggestions,
-                column_analysis=column_analysis
-            )
-            
+            return await file_cache.get_or_compute("chart_suggestions", file_path, cls._suggest_charts)
         except Exception as e:
-            raise ValueError(f"Error analyzing data for chart suggestions: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"Error analyzing data for chart suggestions: {str(e)}")
+    
+    @classmethod
+    def _suggest_charts(cls, file_path: str) -> ChartSuggestionsResponse:
+        df = cls._load_data(file_path)
+        
+        # Analyze columns
+        numeric_columns, categorical_columns = classify_columns(df)
+        
+        column_analysis = {
+            'total_columns': len(df.columns),
+            'numeric_columns': len(numeric_columns),
+            'categorical_columns': len(categorical_columns),
+            'total_rows': len(df),
+            'numeric_column_names': numeric_columns,
+            'categorical_column_names': categorical_columns
+        }
+        
+        suggestions = []
+        
+        # Scatter plot suggestions
+        if len(numeric_columns) >= 2:
+            suggestions.append(ChartSuggestion(
+                chart_type=ChartType.SCATTER,
+                confidence=0.9,
+                reason="Multiple numeric columns available for correlation analysis",
+                required_columns=numeric_columns[:2],
+                optional_columns=categorical_columns + numeric_columns[2:]
+            ))
+        
+        # Histogram suggestions
+        if len(numeric_columns) >= 1:
+            suggestions.append(ChartSuggestion(
+                chart_type=ChartType.HISTOGRAM,
+                confidence=0.8,
+                reason="Numeric columns available for distribution analysis",
+                required_columns=numeric_columns[:1],
+                optional_columns=categorical_columns
+            ))
+        
+        # Boxplot suggestions
+        if len(numeric_columns) >= 1:
+            confidence = 0.9 if len(categorical_columns) >= 1 else 0.7
+            reason = "Numeric columns available for distribution analysis"
+            if len(categorical_columns) >= 1:
+                reason += " with categorical grouping available"
+            
+            suggestions.append(ChartSuggestion(
+                chart_type=ChartType.BOXPLOT,
+                confidence=confidence,
+                reason=reason,
+                required_columns=numeric_columns[:1],
+                optional_columns=categorical_columns
+            ))
+        
+        # Bar chart suggestions
+        if len(categorical_columns) >= 1 and len(numeric_columns) >= 1:
+            suggestions.append(ChartSuggestion(
+                chart_type=ChartType.BAR,
+                confidence=0.8,
+                reason="Categorical and numeric columns available for aggregated comparison",
+                required_columns=[categorical_columns[0], numeric_columns[0]],
+                optional_columns=categorical_columns[1:] + numeric_columns[1:]
+            ))
+        
+        # Sort by confidence
+        suggestions.sort(key=lambda x: x.confidence, reverse=True)
+        
+        return ChartSuggestionsResponse(
+            suggestions=suggestions,
+            column_analysis=column_analysis
+        )
\ No newline at end of file
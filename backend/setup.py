@@ -18,7 +18,10 @@ setup(
         "pytest-asyncio>=1.2.0",
         "httpx>=0.28.1",
         "pandas>=2.1.0",
+        "pyarrow>=14.0.0",
         "numpy>=1.24.0",
         "email-validator>=2.2.0",
+        "cachetools>=5.3.0",
+        "orjson>=3.9.0",
     ],
 )
\ No newline at end of file
@@ -0,0 +1,40 @@
+import pytest
+
+from app import crud
+from app.crud import csv_file_cache
+from app.models.csv_file import CSVFile
+
+
+@pytest.fixture
+def db(db):
+    db.add(CSVFile(id=1, filename="a.csv", original_filename="a.csv", file_path="/data/a.csv", user_id=1))
+    db.commit()
+    csv_file_cache.invalidate(1)
+    yield db
+    csv_file_cache.invalidate(1)
+
+
+class TestCSVFileCache:
+
+    def test_returns_lightweight_ref(self, db):
+        ref = csv_file_cache.get_cached(db, 1)
+        assert ref == csv_file_cache.CSVFileRef(id=1, file_path="/data/a.csv", user_id=1)
+
+    def test_repeat_lookups_skip_the_database(self, db, sql_statements):
+        csv_file_cache.get_cached(db, 1)
+        csv_file_cache.get_cached(db, 1)
+        assert len(sql_statements) == 1
+
+    def test_missing_file_is_not_cached(self, db):
+        assert csv_file_cache.get_cached(db, 2) is None
+        db.add(CSVFile(id=2, filename="b.csv", original_filename="b.csv", file_path="/data/b.csv", user_id=1))
+        db.commit()
+        try:
+            assert csv_file_cache.get_cached(db, 2).file_path == "/data/b.csv"
+        finally:
+            csv_file_cache.invalidate(2)
+
+    def test_remove_invalidates(self, db):
+        assert csv_file_cache.get_cached(db, 1) is not None
+        crud.csv_file.remove(db, id=1)
+        assert csv_file_cache.get_cached(db, 1) is None
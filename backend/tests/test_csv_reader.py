@@ -0,0 +1,50 @@
+import pandas as pd
+import pytest
+
+from app.services.csv_reader import classify_columns, read_csv
+from app.services.stats_service import _compute_descriptive_stats
+
+
+@pytest.fixture
+def timestamp_csv(tmp_path):
+    path = tmp_path / "events.csv"
+    path.write_text(
+        "recorded_at,flag,count,label\n"
+        "2024-01-01 10:00:00,true,1,a\n"
+        "2024-01-02 11:00:00,false,2,b\n"
+    )
+    return path
+
+
+class TestCSVReader:
+
+    @pytest.mark.parametrize("nrows", [None, 1001])
+    def test_timestamp_column_is_categorical_on_both_read_paths(self, timestamp_csv, nrows):
+        numeric, categorical = classify_columns(read_csv(timestamp_csv, nrows=nrows))
+        assert numeric == ["count"]
+        assert categorical == ["recorded_at", "flag", "label"]
+
+    def test_stats_cover_every_non_numeric_column(self, timestamp_csv):
+        stats = _compute_descriptive_stats(str(timestamp_csv))
+        assert set(stats["categorical"]) == {"recorded_at", "flag", "label"}
+        assert stats["column_types"]["recorded_at"] == "categorical"
+        assert stats["overall"]["categorical_columns"] == 3
+        assert stats["categorical"]["recorded_at"]["unique"] == 2
+
+    def test_numeric_covers_all_int_and_float_dtypes(self):
+        df = pd.DataFrame({
+            "i32": pd.Series([1], dtype="int32"),
+            "u8": pd.Series([1], dtype="uint8"),
+            "f32": pd.Series([1.0], dtype="float32"),
+            "nullable": pd.Series([1], dtype="Int64"),
+            "flag": pd.Series([True]),
+            "cat": pd.Series(["x"], dtype="category"),
+        })
+        assert classify_columns(df) == (["i32", "u8", "f32", "nullable"], ["flag", "cat"])
+
+    @pytest.mark.parametrize("nrows", [None, 1001])
+    def test_empty_file_raises_empty_data_error(self, tmp_path, nrows):
+        path = tmp_path / "empty.csv"
+        path.write_text("")
+        with pytest.raises(pd.errors.EmptyDataError):
+            read_csv(path, nrows=nrows)
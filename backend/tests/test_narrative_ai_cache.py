@@ -0,0 +1,71 @@
+import pytest
+
+from app.schemas.narratives import DataSummaryNarrativeRequest, NarrativeType
+from app.services import narrative_service
+from app.services.narrative_service import NarrativeService
+
+
+class FakeResponse:
+
+    def __init__(self, body):
+        self.body = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.body
+
+
+class FakeSession:
+
+    def __init__(self, *bodies):
+        self.bodies = list(bodies)
+        self.calls = 0
+
+    def post(self, *args, **kwargs):
+        self.calls += 1
+        return FakeResponse(self.bodies.pop(0))
+
+
+@pytest.fixture
+def request_():
+    return DataSummaryNarrativeRequest(
+        narrative_type=NarrativeType.DATA_SUMMARY, total_rows=10, total_columns=2
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    narrative_service._ai_response_cache.clear()
+    yield
+    narrative_service._ai_response_cache.clear()
+
+
+def _use_session(monkeypatch, session):
+    monkeypatch.setattr(narrative_service, "_get_http_session", lambda: session)
+
+
+GOOD_BODY = {"title": "AI title", "summary": "s", "content": "c"}
+
+
+class TestCustomEndpointCache:
+
+    def test_valid_response_is_cached(self, monkeypatch, request_):
+        session = FakeSession(GOOD_BODY)
+        _use_session(monkeypatch, session)
+        service = NarrativeService(None)
+        first = service._generate_with_custom_endpoint(request_, "http://ai.test")
+        second = service._generate_with_custom_endpoint(request_, "http://ai.test")
+        assert first.title == second.title == "AI title"
+        assert session.calls == 1
+
+    @pytest.mark.parametrize("bad_body", [["not", "an", "object"], {"title": 42}])
+    def test_invalid_response_is_not_cached(self, monkeypatch, request_, bad_body):
+        session = FakeSession(bad_body, GOOD_BODY)
+        _use_session(monkeypatch, session)
+        service = NarrativeService(None)
+        with pytest.raises(Exception):
+            service._generate_with_custom_endpoint(request_, "http://ai.test")
+        assert service._generate_with_custom_endpoint(request_, "http://ai.test").title == "AI title"
+        assert session.calls == 2
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import pytest
+
+from app.crud.narrative import decode_cursor, encode_cursor, narrative_crud
+from app.models.narrative import Narrative
+
+
+@pytest.fixture
+def db(db):
+    # Pairs of narratives share a created_at so pages have to break ties on id
+    for i in range(1, 8):
+        db.add(Narrative(
+            id=i, title=f"n{i}", summary="s", content="c", narrative_type="data_summary",
+            generation_method="template", user_id=1, created_at=datetime(2026, 1, 1, 12, i // 2)
+        ))
+    db.commit()
+    return db
+
+
+def _walk(db, **kwargs):
+    pages, cursor = [], None
+    while True:
+        rows = narrative_crud.get_narrative_summaries(db, user_id=1, limit=3, cursor=cursor, **kwargs)
+        pages.append([row["id"] for row in rows])
+        if len(rows) < 3:
+            return pages
+        cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+
+
+class TestNarrativeKeysetPagination:
+
+    def test_cursor_round_trip(self):
+        created_at = datetime(2026, 1, 1, 12, 30, 15, 250)
+        assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+    @pytest.mark.parametrize("cursor", ["not base64!", "bm90IGEgY3Vyc29y"])
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor(cursor)
+
+    def test_pages_descending(self, db):
+        assert _walk(db) == [[7, 6, 5], [4, 3, 2], [1]]
+
+    def test_pages_ascending(self, db):
+        assert _walk(db, order_desc=False) == [[1, 2, 3], [4, 5, 6], [7]]
+
+    def test_cursor_matches_offset_pages(self, db):
+        offset_pages = [
+            [row["id"] for row in narrative_crud.get_narrative_summaries(db, user_id=1, limit=3, offset=offset)]
+            for offset in (0, 3, 6)
+        ]
+        assert _walk(db) == offset_pages
+
+    def test_cursor_requires_created_at_ordering(self, db):
+        with pytest.raises(ValueError, match="order_by=created_at"):
+            narrative_crud.get_narrative_summaries(
+                db, order_by="title", cursor=encode_cursor(datetime(2026, 1, 1), 1)
+            )
+
+    @pytest.mark.parametrize("order_by", ["csv_file", "__class__", "bogus"])
+    def test_unknown_order_by_falls_back_to_created_at(self, db, order_by):
+        rows = narrative_crud.get_narrative_summaries(db, user_id=1, order_by=order_by)
+        assert [row["id"] for row in rows] == [7, 6, 5, 4, 3, 2, 1]
@@ -0,0 +1,81 @@
+import pytest
+
+from app.crud.narrative import narrative_crud
+from app.models.narrative import Narrative, NarrativeTag
+from app.schemas.narratives import NarrativeResponse
+
+
+@pytest.fixture
+def db(db):
+    for i, tags in enumerate([["ml", "stats"], ["html"], ["stats"], []], start=1):
+        narrative = Narrative(
+            id=i, title=f"n{i}", summary="s", content="c", narrative_type="data_summary",
+            generation_method="template", user_id=1
+        )
+        narrative.tag_list = tags
+        db.add(narrative)
+    db.commit()
+    return db
+
+
+def _ids(rows):
+    return sorted(row["id"] for row in rows)
+
+
+class TestNarrativeTags:
+
+    def test_tag_list_strips_and_dedupes_in_order(self, db):
+        narrative = narrative_crud.get_narrative(db, 4)
+        narrative.tag_list = [" b ", "a", "", "b"]
+        db.commit()
+        db.expire_all()
+        assert narrative_crud.get_narrative(db, 4).tag_list == ["b", "a"]
+
+    def test_summaries_include_tags(self, db):
+        rows = {row["id"]: row["tags"] for row in narrative_crud.get_narrative_summaries(db)}
+        assert rows == {1: ["ml", "stats"], 2: ["html"], 3: ["stats"], 4: []}
+
+    def test_filter_matches_whole_tags(self, db):
+        assert _ids(narrative_crud.get_narrative_summaries(db, tags=["ml"])) == [1]
+        assert _ids(narrative_crud.get_narrative_summaries(db, tags=["html", "stats"])) == [1, 2, 3]
+        assert narrative_crud.get_narrative_summaries(db, tags=["m"]) == []
+
+    def test_update_reorders_and_replaces_tags(self, db):
+        narrative_crud.update_narrative(db, 1, {"tags": ["stats", "new"]})
+        db.expire_all()
+        assert narrative_crud.get_narrative(db, 1).tag_list == ["stats", "new"]
+        assert db.query(NarrativeTag).filter(NarrativeTag.name == "ml").count() == 0
+
+    def test_delete_removes_tags(self, db):
+        assert narrative_crud.delete_narrative(db, 1) is True
+        assert narrative_crud.get_narrative(db, 1) is None
+        assert db.query(NarrativeTag).filter(NarrativeTag.narrative_id == 1).count() == 0
+        assert narrative_crud.delete_narrative(db, 1) is False
+
+    def test_stats_top_tags(self, db):
+        stats = narrative_crud.get_narrative_stats(db, user_id=1)
+        assert stats["top_tags"] == [("stats", 2), ("html", 1), ("ml", 1)]
+
+    def test_stats_counts_every_type(self, db):
+        db.get(Narrative, 2).narrative_type = "statistical_test"
+        db.get(Narrative, 4).narrative_type = "report"
+        db.commit()
+        stats = narrative_crud.get_narrative_stats(db, user_id=1)
+        assert list(stats["by_type"].items()) == [("statistical_test", 1), ("data_summary", 2), ("report", 1)]
+
+    def test_bulk_create_tags_every_narrative(self, db):
+        narratives = [
+            NarrativeResponse(
+                title=title, summary="s", content="c", narrative_type="data_summary",
+                key_insights=[{"title": "i", "description": "d", "priority": "high", "confidence": "high"}],
+                metadata={"generation_method": "template"}
+            )
+            for title in ("b1", "b2")
+        ]
+        created = narrative_crud.bulk_create_narratives(db, narratives, user_id=1, tags=["new", "stats"])
+        db.expire_all()
+        for (narrative_id, created_at), title in zip(created, ("b1", "b2")):
+            narrative = narrative_crud.get_narrative(db, narrative_id)
+            assert (narrative.title, narrative.created_at) == (title, created_at)
+            assert narrative.tag_list == ["new", "stats"]
+            assert narrative.insights_count == 1
@@ -0,0 +1,41 @@
+import pytest
+from starlette.requests import Request
+
+from app.core.responses import etag_matches, make_etag, not_modified
+
+
+def _request(if_none_match=None):
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+class TestETags:
+
+    def test_make_etag_is_quoted_and_stable(self):
+        etag = make_etag(b"payload")
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == make_etag(b"payload")
+        assert etag != make_etag(b"other payload")
+
+    @pytest.mark.parametrize("header", [None, "", '"deadbeef"'])
+    def test_no_match(self, header):
+        assert not etag_matches(_request(header), make_etag(b"payload"))
+
+    def test_exact_match(self):
+        etag = make_etag(b"payload")
+        assert etag_matches(_request(etag), etag)
+
+    def test_weak_and_listed_match(self):
+        etag = make_etag(b"payload")
+        assert etag_matches(_request(f'"deadbeef", W/{etag}'), etag)
+
+    def test_wildcard_match(self):
+        assert etag_matches(_request("*"), make_etag(b"payload"))
+
+    def test_not_modified_headers(self):
+        etag = make_etag(b"payload")
+        response = not_modified(etag, "public, max-age=30")
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+        assert response.headers["cache-control"] == "public, max-age=30"
@@ -0,0 +1,50 @@
+import time
+from datetime import timedelta
+
+import pytest
+from jose import jwt, JWTError
+
+from app.core.config import settings
+from app.core.security import create_access_token, verify_hs256
+
+
+class TestFastVerifyHS256:
+    """The HS256 fast path must accept exactly what jose.jwt.decode accepts."""
+
+    def test_valid_token(self):
+        token = create_access_token(42)
+        payload = verify_hs256(token, settings.SECRET_KEY)
+        assert payload == jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+        assert payload["sub"] == "42"
+
+    def test_wrong_secret(self):
+        token = create_access_token(42)
+        with pytest.raises(JWTError):
+            verify_hs256(token, "not-the-secret")
+
+    def test_tampered_payload(self):
+        header, _, sig = create_access_token(42).split(".")
+        forged_payload = create_access_token(1).split(".")[1]
+        with pytest.raises(JWTError):
+            verify_hs256(f"{header}.{forged_payload}.{sig}", settings.SECRET_KEY)
+
+    def test_expired_token(self):
+        token = create_access_token(42, expires_delta=timedelta(seconds=-10))
+        with pytest.raises(JWTError):
+            verify_hs256(token, settings.SECRET_KEY)
+
+    def test_other_algorithm_rejected(self):
+        token = jwt.encode(
+            {"sub": "42", "exp": int(time.time()) + 60}, settings.SECRET_KEY, algorithm="HS512"
+        )
+        with pytest.raises(JWTError):
+            verify_hs256(token, settings.SECRET_KEY)
+
+    @pytest.mark.parametrize("token", ["", "abc", "a.b", "a.b.c", "..."])
+    def test_malformed_token(self, token):
+        with pytest.raises(JWTError):
+            verify_hs256(token, settings.SECRET_KEY)
+
+    def test_bytes_secret(self):
+        token = create_access_token(42)
+        assert verify_hs256(token, settings.SECRET_KEY.encode())["sub"] == "42"
@@ -186,6 +186,44 @@ class TestStatisticalTestsService:
             finally:
                 os.unlink(f.name)
 
+    @pytest.mark.asyncio
+    async def test_batch_ttests_match_single_tests(self, temp_csv_file):
+        """Test that batched one-sample t-tests match the one-at-a-time results."""
+        tests = [('numeric_col', 85, 0.05), ('numeric_col2', 95, 0.01), ('numeric_col', 100, 0.05)]
+        results = await StatisticalTestsService.batch_ttests(
+            file_path=temp_csv_file,
+            variable_columns=[column for column, _, _ in tests],
+            test_values=[value for _, value, _ in tests],
+            alphas=[alpha for _, _, alpha in tests]
+        )
+
+        assert len(results) == len(tests)
+        for (column, value, alpha), result in zip(tests, results):
+            expected = await StatisticalTestsService.one_sample_ttest(
+                file_path=temp_csv_file,
+                variable_column=column,
+                test_value=value,
+                alpha=alpha
+            )
+            assert result.test_statistic == pytest.approx(expected.test_statistic)
+            assert result.p_value == pytest.approx(expected.p_value)
+            assert result.confidence_interval_lower == pytest.approx(expected.confidence_interval_lower)
+            assert result.confidence_interval_upper == pytest.approx(expected.confidence_interval_upper)
+            assert result.effect_size == pytest.approx(expected.effect_size)
+            assert result.sample_size == expected.sample_size
+            assert result.interpretation == expected.interpretation
+
+    @pytest.mark.asyncio
+    async def test_batch_ttests_invalid_column_error(self, temp_csv_file):
+        """Test that one bad column fails the whole batch."""
+        with pytest.raises(ValueError, match="Column 'nonexistent' not found"):
+            await StatisticalTestsService.batch_ttests(
+                file_path=temp_csv_file,
+                variable_columns=['numeric_col', 'nonexistent'],
+                test_values=[100, 100],
+                alphas=[0.05, 0.05]
+            )
+
 
 # Note: API endpoint tests would require additional setup with test database
 # and test client. For now, we focus on service-level testing.
\ No newline at end of file
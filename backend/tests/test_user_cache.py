@@ -0,0 +1,35 @@
+import pytest
+
+from app import crud
+from app.api import deps
+from app.core.security import create_access_token
+from app.crud import user_cache
+from app.models.user import User
+from app.schemas.user import UserUpdate
+
+
+@pytest.fixture
+def db(db):
+    user_cache.invalidate(1)
+    yield db
+    user_cache.invalidate(1)
+
+
+class TestUserCache:
+
+    def test_repeat_lookups_skip_the_database(self, db, sql_statements):
+        token = create_access_token(1)
+        deps.get_current_user(db=db, token=token)
+        db.expunge_all()
+        assert deps.get_current_user(db=db, token=token).email == "owner@example.com"
+        assert len(sql_statements) == 1
+
+    def test_update_is_visible_on_next_request(self, db):
+        token = create_access_token(1)
+        assert deps.get_current_user(db=db, token=token).is_active is True
+
+        crud.user.update(db, db_obj=db.get(User, 1), obj_in=UserUpdate(is_active=False, full_name="Renamed"))
+        db.expunge_all()
+
+        user = deps.get_current_user(db=db, token=token)
+        assert (user.is_active, user.full_name) == (False, "Renamed")